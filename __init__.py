@@ -0,0 +1,45 @@
+#
+# msctools: my collection of composing and performing tools in python
+#
+# © 2023 Marco Buongiorno Nardelli
+#
+
+# the submodules and the public API are imported on first use, so that e.g.
+#	from msctools import Track
+# does not pay for networkx, music21 or pyo
+
+import importlib
+
+_modules = ['asynctools','base','benchmarks','cfg','converters','decorators','devices','dictionaries',
+			'dsp','envelopes','keyframes','mirror','networks','osctools','pan','players','pyotools','recorder','scheduler',
+			'session','utils','videocapture']
+
+_api = {
+	'base': ['Song','Track','Clip','ClipSlot','Device','wavdur'],
+	'session': ['setSession','loadSession','trackList','clipList','deviceList','clipDurations'],
+	'osctools': ['client','bundle','bundleSend','query','queryAll','server','serverSpat','close_pool'],
+	'devices': ['Dolby','SpatControl','Spat'],
+	'players': ['playerA','playerB','scorePlayer','playScene'],
+	'envelopes': ['volumes','multiEnvLive','crescendo','decrescendo','setVol','lines','lineCycle',
+				'circles','circlesCar','circlesDeg','trajectory','follow'],
+	'pan': ['panning'],
+	'scheduler': ['spawn','beatclock','sender','lateStats','onsetStats'],
+	'mirror': ['watchSong','watchTracks','watchClips','watchDevice'],
+	'converters': ['db2value','value2db','db4value','scale','s2c','c2s'],
+	'networks': ['chinese_postman','sequence'],
+	'decorators': ['threading_decorator','task'],
+}
+
+_names = {name:module for module,names in _api.items() for name in names}
+
+def __getattr__(name):
+	if name in _modules:
+		return(importlib.import_module('.'+name,__name__))
+	if name in _names:
+		value = getattr(importlib.import_module('.'+_names[name],__name__),name)
+		globals()[name] = value
+		return(value)
+	raise AttributeError('module {!r} has no attribute {!r}'.format(__name__,name))
+
+def __dir__():
+	return(sorted(list(globals().keys())+_modules+list(_names.keys())))
@@ -0,0 +1,297 @@
+#
+# msctools: my collection of composing and performing tools in python
+#
+# © 2023 Marco Buongiorno Nardelli
+#
+
+# asyncio transport and async counterparts of the Live object API in base.py
+# usage:
+#	async def main():
+#		await connect()
+#		session,tracks,devices,clips = await setSession()
+#		print(await tracks[0].volume(mode='get'))
+#	asyncio.run(main())
+
+import asyncio
+import numpy as np
+
+from pythonosc.osc_message import OscMessage
+from pythonosc.osc_bundle import OscBundle
+
+from .osctools import message, request, router, replies, watchers
+from .base import Song, Track, Clip, Device, _cachedur
+from .converters import *
+import msctools.cfg as cfg
+
+class _future_request(request):
+	# outstanding query resolved through an asyncio future (from any thread)
+	def __init__(self,address,prefix,loop):
+		super().__init__(address,prefix)
+		self.loop = loop
+		self.future = loop.create_future()
+
+	def resolve(self,args):
+		self.args = args
+		self.loop.call_soon_threadsafe(self._set,args)
+
+	def _set(self,args):
+		if not self.future.done():
+			self.future.set_result(args)
+
+def _contents(packet):
+	# flatten (possibly nested) bundles into a list of messages
+	if isinstance(packet,OscBundle):
+		msgs = []
+		for content in packet:
+			msgs += _contents(content)
+		return(msgs)
+	return([packet])
+
+class _protocol(asyncio.DatagramProtocol):
+
+	def __init__(self,replies):
+		self.replies = replies
+
+	def datagram_received(self,data,addr):
+		try:
+			if OscBundle.dgram_is_bundle(data):
+				msgs = _contents(OscBundle(data))
+			else:
+				msgs = [OscMessage(data)]
+		except Exception:
+			return
+		for msg in msgs:
+			for watcher in watchers:
+				watcher(msg.address,tuple(msg.params))
+			if msg.address == '/live/song/beat':
+				cfg.livebeat = tuple(msg.params)
+			else:
+				self.replies.dispatch(msg.address,tuple(msg.params))
+
+	def error_received(self,exc):
+		pass
+
+class transport:
+	'''
+	Datagram endpoint that sends queries to Live and receives the replies
+	listen = (ip,port) where AbletonOSC sends its replies
+	listen = None sends only, and relies on a running osctools.server for the replies
+	limit = maximum number of queries in flight at the same time
+	'''
+	def __init__(self,host=cfg.HOST,port=cfg.PORT,listen=(cfg.HOST,cfg.REPLY_PORT),limit=64):
+		self.host = host
+		self.port = port
+		self.listen = listen
+		self.limit = limit
+		if listen is None:
+			self.replies = replies
+		else:
+			self.replies = router()
+		self.udp = None
+
+	async def open(self):
+		loop = asyncio.get_running_loop()
+		local = self.listen if self.listen is not None else ('0.0.0.0',0)
+		self.udp,_ = await loop.create_datagram_endpoint(lambda: _protocol(self.replies),local_addr=local)
+		self.inflight = asyncio.Semaphore(self.limit)
+		return(self)
+
+	def close(self):
+		if self.udp is not None:
+			self.udp.close()
+			self.udp = None
+
+	def send(self,address,values,host=None,port=None):
+		self.udp.sendto(message(address,values).dgram,(host or self.host,port or self.port))
+
+	async def query(self,address,values,host=None,port=None,timeout=None):
+		if timeout is None:
+			timeout = cfg.TIMEOUT
+		loop = asyncio.get_running_loop()
+		async with self.inflight:
+			req = self.replies.expect(address,values,lambda a,p: _future_request(a,p,loop))
+			self.send(address,values,host,port)
+			try:
+				return(await asyncio.wait_for(req.future,timeout))
+			except asyncio.TimeoutError:
+				self.replies.cancel(req)
+				raise TimeoutError('no reply to {} {} from {}:{}'.format(address,values,
+									host or self.host,port or self.port))
+
+_transport = None
+
+async def connect(host=cfg.HOST,port=cfg.PORT,listen=(cfg.HOST,cfg.REPLY_PORT),limit=64):
+	# open the default transport used by the async classes
+	global _transport
+	if _transport is not None:
+		_transport.close()
+	_transport = await transport(host,port,listen,limit).open()
+	return(_transport)
+
+def disconnect():
+	global _transport
+	if _transport is not None:
+		_transport.close()
+		_transport = None
+
+class _async:
+	# common plumbing of the async classes
+	def query(self,address,values):
+		tr = self.transport or _transport
+		assert tr is not None, 'no transport - await connect() first'
+		return(tr.query(address,values,self.host,self.port))
+
+	def send(self,address,values):
+		tr = self.transport or _transport
+		assert tr is not None, 'no transport - await connect() first'
+		tr.send(address,values,self.host,self.port)
+
+# async counterparts of the base classes: getters are coroutines, setters are inherited
+
+class ASong(_async,Song):
+
+	def __init__(self,host=cfg.HOST,port=cfg.PORT,transport=None):
+		super().__init__(host,port)
+		self.transport = transport
+
+	async def session_record(self):
+		return((await self.query("/live/song/get/session_record",[]))[0])
+
+	async def num_tracks(self):
+		return((await self.query("/live/song/get/num_tracks",[]))[0])
+
+	async def num_scenes(self):
+		return((await self.query("/live/song/get/num_scenes",[]))[0])
+
+	async def tempo(self,bpm=None,mode='set'):
+		if mode == 'set':
+			self.send("/live/song/set/tempo",[bpm])
+		if mode == 'get':
+			return((await self.query("/live/song/get/tempo",[]))[0])
+
+class ATrack(_async,Track):
+
+	def __init__(self,track,host=cfg.HOST,port=cfg.PORT,transport=None):
+		super().__init__(track,host,port)
+		self.transport = transport
+
+	async def volume(self,vol=db2value(0.0),mode='set'):
+		if mode == 'setdb':
+			self.send("/live/track/set/volume",[self.n,db2value(vol)])
+		if mode == 'set':
+			self.send("/live/track/set/volume",[self.n,vol])
+		if mode == 'get':
+			return(value2db((await self.query("/live/track/get/volume",[self.n]))[1]))
+
+	async def name(self,names=None,mode='set'):
+		if mode == 'set':
+			self.send("/live/track/set/name",[self.n,names])
+		if mode == 'get':
+			return((await self.query("/live/track/get/name",[self.n]))[1])
+
+	async def arrangement(self,mode='name'):
+		if mode in ['name','length','start_time']:
+			return((await self.query("/live/track/get/arrangement_clips/"+mode,[self.n]))[1])
+
+	async def nclips(self):
+		return(len(await self.query("/live/track/get/clips/name",[self.n]))-1)
+
+	async def ndevices(self):
+		return((await self.query("/live/track/get/num_devices",[self.n]))[1])
+
+	async def devnames(self):
+		return((await self.query("/live/track/get/devices/name",[self.n]))[1])
+
+class AClip(_async,Clip):
+
+	def __init__(self,track,clip,host=cfg.HOST,port=cfg.PORT,transport=None):
+		super().__init__(track,clip,host,port)
+		self.transport = transport
+
+	async def name(self,names=None,mode='set'):
+		if mode == 'set':
+			self.send("/live/clip/set/name",[self.n,self.c,names])
+		if mode == 'get':
+			return((await self.query("/live/clip/get/name",[self.n,self.c]))[2])
+
+	async def fpath(self):
+		return((await self.query("/live/clip/get/file_path",[self.n,self.c]))[2])
+
+	async def dur(self,refresh=False):
+		dur = None if refresh else _cachedur((self.host,self.port,self.n,self.c))
+		if dur is None:
+			# the header is read in a worker thread, not on the event loop
+			fil = await self.fpath()
+			dur = await asyncio.get_running_loop().run_in_executor(None,self.prefetch,fil)
+		return(dur)
+
+class ADevice(_async,Device):
+
+	def __init__(self,track,device,controls=None,host=cfg.HOST,port=cfg.PORT,transport=None):
+		super().__init__(track,device,controls,host,port)
+		self.transport = transport
+
+	async def name(self):
+		return((await self.query("/live/device/get/name",[self.n,self.d]))[2])
+
+	async def num(self):
+		return((await self.query("/live/device/get/num_parameters",[self.n,self.d]))[2])
+
+	async def max(self):
+		return((await self.query("/live/device/get/parameters/max",[self.n,self.d]))[2])
+
+	async def min(self):
+		return((await self.query("/live/device/get/parameters/min",[self.n,self.d]))[2])
+
+	async def parameters(self):
+		res = await asyncio.gather(*[self.query("/live/device/get/parameters/"+what,[self.n,self.d])
+									for what in ['name','value','min','max']])
+		names,values,mins,maxs = [list(args[2:]) for args in res]
+		return(np.array(names),np.array(values,dtype=float),np.array(mins,dtype=float),np.array(maxs,dtype=float))
+
+	async def cntrldict(self,mode='get'):
+		if mode =='get':
+			keys,values,_,_ = await self.parameters()
+			pardict = dict(zip(keys.tolist(),values.tolist()))
+			assert len(pardict) == len(keys),'duplicate keys - use cntrllist method instead'
+			return(pardict)
+		if mode =='set':
+			self.send("/live/device/set/parameters/value",[self.n,self.d]+list(self.cntr.values()))
+
+	async def cntrllist(self,mode='get',bounds=False):
+		if mode =='get':
+			keys,values,mins,maxs = await self.parameters()
+			if bounds:
+				return(keys,values,mins,maxs)
+			return(keys,values)
+		if mode =='set':
+			self.send("/live/device/set/parameters/value",[self.n,self.d]+self.cntr)
+
+	async def param(self,n,val=None,mode='name'):
+		if mode == 'name':
+			return((await self.query("/live/device/get/parameter/name",[self.n,self.d,n]))[3])
+		if mode == 'get':
+			return((await self.query("/live/device/get/parameter/value",[self.n,self.d,n]))[3])
+		if mode == 'set':
+			self.send("/live/device/set/parameter/value",[self.n,self.d,n,val])
+
+async def setSession(host=cfg.HOST,port=cfg.PORT,transport=None):
+	# async version of session.setSession: all queries of a level are in flight together
+	session = ASong(host,port,transport)
+	num_tracks = await session.num_tracks()
+	tracks = [ATrack(t,host,port,transport) for t in range(num_tracks)]
+
+	async def count(tr):
+		# one reply per track with the clip names of all slots (None if empty)
+		try:
+			args = await tr.query("/live/track/get/clips/name",[tr.n])
+		except TimeoutError:
+			return(0)
+		return(sum(name != None for name in args[1:]))
+
+	num_clips = await asyncio.gather(*[count(tr) for tr in tracks])
+	clips = [[AClip(n,i,host,port,transport) for i in range(num_clips[n])] for n in range(num_tracks)]
+	num_devices = await asyncio.gather(*[tr.ndevices() for tr in tracks])
+	devices = [[ADevice(n,i,host=host,port=port,transport=transport) for i in range(num_devices[n])]
+				for n in range(num_tracks)]
+	return(session,tracks,devices,clips)
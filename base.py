@@ -4,14 +4,110 @@
 # © 2023 Marco Buongiorno Nardelli
 #
 
-import time
+import os, struct, time
 import numpy as np
-from scipy.io import wavfile
 
-from .osctools import client
+from .osctools import client, query, queryAll
+from .mirror import state
 from .converters import *
 import msctools.cfg as cfg
 
+def _extended(b):
+	# 80-bit IEEE 754 extended float (AIFF sample rate)
+	exp = struct.unpack('>H',b[:2])[0]
+	mant = struct.unpack('>Q',b[2:10])[0]
+	sign = -1 if exp & 0x8000 else 1
+	exp &= 0x7fff
+	if exp == 0 and mant == 0:
+		return(0.0)
+	return(sign*mant*2.0**(exp-16383-63))
+
+def _headerdur(fil):
+	# duration from the WAV (RIFF/RIFX/RF64) or AIFF/AIFC header, without reading the samples
+	with open(fil,'rb') as f:
+		head = f.read(12)
+		if head[:4] in (b'RIFF',b'RIFX',b'RF64') and head[8:12] == b'WAVE':
+			end = '<' if head[:4] != b'RIFX' else '>'
+			sr = align = nbytes = None
+			while sr is None or nbytes is None:
+				chunk = f.read(8)
+				if len(chunk) < 8:
+					break
+				cid = chunk[:4]
+				size = struct.unpack(end+'I',chunk[4:])[0]
+				if cid == b'ds64':
+					nbytes = struct.unpack('<Q',f.read(size)[8:16])[0]
+					continue
+				if cid == b'fmt ':
+					fmt = f.read(size)
+					sr = struct.unpack(end+'I',fmt[4:8])[0]
+					align = struct.unpack(end+'H',fmt[12:14])[0]
+				elif cid == b'data':
+					if nbytes is None or size != 0xffffffff:
+						nbytes = size
+					break
+				else:
+					f.seek(size,1)
+				if size % 2:
+					f.seek(1,1)
+			assert sr and align and nbytes is not None, 'incomplete wav header'
+			return(nbytes/align/sr)
+		if head[:4] == b'FORM' and head[8:12] in (b'AIFF',b'AIFC'):
+			while True:
+				chunk = f.read(8)
+				assert len(chunk) == 8, 'no COMM chunk in aiff header'
+				cid = chunk[:4]
+				size = struct.unpack('>I',chunk[4:])[0]
+				if cid == b'COMM':
+					comm = f.read(size)
+					nframes = struct.unpack('>I',comm[2:6])[0]
+					return(nframes/_extended(comm[8:18]))
+				f.seek(size+size%2,1)
+	raise ValueError('unknown audio file format: '+fil)
+
+_durations = {}
+
+def wavdur(fil):
+	# duration in seconds of an audio file, read from the header only and cached per (path, mtime)
+	key = (fil,os.path.getmtime(fil))
+	try:
+		return(_durations[key])
+	except KeyError:
+		pass
+	try:
+		dur = _headerdur(fil)
+	except (ValueError,AssertionError,struct.error):
+		# fall back to reading the whole file
+		from scipy.io import wavfile
+		sr, wav = wavfile.read(fil)
+		dur = wav.shape[0]/sr
+	_durations[key] = dur
+	return(dur)
+
+# durations of the clips: (host,port,track,clip,file path) -> (mtime, duration), and the
+# last file path read for each clip slot: (host,port,track,clip) -> file path
+_clipdur = {}
+_clippath = {}
+
+def _slotpath(slot):
+	# file path of a clip slot: as pushed by Live if watched (see mirror.watchClips), so that
+	# a replaced sample is seen right away, otherwise the last one read
+	val = state.get("/live/clip/get/file_path",slot[2:])
+	if val is not None:
+		return(val[0])
+	return(_clippath.get(slot))
+
+def _cachedur(slot):
+	# cached duration of a clip, None if not cached for its file or if the file changed since
+	fil = _slotpath(slot)
+	try:
+		mtime,dur = _clipdur[slot+(fil,)]
+		if os.path.getmtime(fil) == mtime:
+			return(dur)
+	except (KeyError,OSError,TypeError):
+		pass
+	return(None)
+
 # base classes
 
 class Song:
@@ -30,40 +126,32 @@ class Song:
 		client("/live/song/stop_all_clips",[],self.host,self.port).send()
 		
 	def session_record(self):
-		client("/live/song/get/session_record",[],self.host,self.port).send()
-		time.sleep(cfg.TICK)
-		return(cfg.data[0])
+		return(query("/live/song/get/session_record",[],self.host,self.port)[0])
 	
 	def test(self):
 		client("/live/test",[],self.host,self.port).send()
 		
 	def num_tracks(self):
-		client("/live/song/get/num_tracks",[],self.host,self.port).send()
-		time.sleep(cfg.TICK)
-		return(cfg.data[0])
+		return(query("/live/song/get/num_tracks",[],self.host,self.port)[0])
 	
 	def num_scenes(self):
-		client("/live/song/get/num_scenes",[],self.host,self.port).send()
-		time.sleep(cfg.TICK)
-		return(cfg.data[0])
+		return(query("/live/song/get/num_scenes",[],self.host,self.port)[0])
 	
 	def create_scene(self,index):
-		client("/live/song/create_scene",[index],self.host,self.port).send()
-		time.sleep(cfg.TICK)
-		return(cfg.data[0])
+		# the reply carries the result of the call, not the index
+		return(query("/live/song/create_scene",[index],self.host,self.port,prefix=[])[0])
 
 	def delete_scene(self,index):
-		client("/live/song/delete_scene",[index],self.host,self.port).send()
-		time.sleep(cfg.TICK)
-		return(cfg.data[0])
+		return(query("/live/song/delete_scene",[index],self.host,self.port,prefix=[])[0])
 	
 	def tempo(self,bpm=None,mode='set'):
 		if mode == 'set':
 			client("/live/song/set/tempo",[bpm],self.host,self.port).send()
 		if mode == 'get':
-			client("/live/song/get/tempo",[],self.host,self.port).send()
-			time.sleep(cfg.TICK)
-			return(cfg.data[0])
+			val = state.get("/live/song/get/tempo")
+			if val is not None:
+				return(val[0])
+			return(query("/live/song/get/tempo",[],self.host,self.port)[0])
 		
 	def add_audio_track(self,N=0):
 		client("/live/song/create_audio_track",[N],self.host,self.port).send()
@@ -99,49 +187,36 @@ class Track:
 		if mode == 'set':
 			client("/live/track/set/volume",[self.n,vol],self.host,self.port).send()
 		if mode == 'get':
-			client("/live/track/get/volume",[self.n],self.host,self.port).send()
-			time.sleep(cfg.TICK)
-			return(value2db(cfg.data[1]))
+			val = state.get("/live/track/get/volume",[self.n])
+			if val is not None:
+				return(value2db(val[0]))
+			return(value2db(query("/live/track/get/volume",[self.n],self.host,self.port)[1]))
 		
 	def name(self,names=None,mode='set'):
 		if mode == 'set':
 			client("/live/track/set/name",[self.n,names],self.host,self.port).send()
 		if mode == 'get':
-			client("/live/track/get/name",[self.n],self.host,self.port).send()
-			time.sleep(cfg.TICK)
-			return(cfg.data[1])
+			return(query("/live/track/get/name",[self.n],self.host,self.port)[1])
 		
 	def panning(self,pan=0,mode='set'):
 		client("/live/track/set/panning",[self.n,pan],self.host,self.port).send()
 		
 	def arrangement(self,mode='name'):
 		if mode == 'name':
-			client("/live/track/get/arrangement_clips/name",[self.n],self.host,self.port).send()
-			time.sleep(cfg.TICK)
-			return(cfg.data[1])
+			return(query("/live/track/get/arrangement_clips/name",[self.n],self.host,self.port)[1])
 		if mode == 'length':
-			client("/live/track/get/arrangement_clips/length",[self.n],self.host,self.port).send()
-			time.sleep(cfg.TICK)
-			return(cfg.data[1])
+			return(query("/live/track/get/arrangement_clips/length",[self.n],self.host,self.port)[1])
 		if mode == 'start_time':
-			client("/live/track/get/arrangement_clips/start_time",[self.n],self.host,self.port).send()
-			time.sleep(cfg.TICK)
-			return(cfg.data[1])
+			return(query("/live/track/get/arrangement_clips/start_time",[self.n],self.host,self.port)[1])
 		
 	def nclips(self):
-		client("/live/track/get/clips/name",[self.n],self.host,self.port).send()
-		time.sleep(cfg.TICK)
-		return((len(cfg.data)-1))
+		return((len(query("/live/track/get/clips/name",[self.n],self.host,self.port))-1))
 	
 	def ndevices(self):
-		client("/live/track/get/num_devices",[self.n],self.host,self.port).send()
-		time.sleep(cfg.TICK)
-		return(cfg.data[1])
+		return(query("/live/track/get/num_devices",[self.n],self.host,self.port)[1])
 	
 	def devnames(self):
-		client("/live/track/get/devices/name",[self.n],self.host,self.port).send()
-		time.sleep(cfg.TICK)
-		return(cfg.data[1])
+		return(query("/live/track/get/devices/name",[self.n],self.host,self.port)[1])
 	
 class Clip:
 	
@@ -155,9 +230,7 @@ class Clip:
 		if mode == 'set':
 			client("/live/clip/set/name",[self.n,self.c,names],self.host,self.port).send()
 		if mode == 'get':
-			client("/live/clip/get/name",[self.n,self.c],self.host,self.port).send()
-			time.sleep(cfg.TICK)
-			return(cfg.data[2])
+			return(query("/live/clip/get/name",[self.n,self.c],self.host,self.port)[2])
 		
 	def fire(self):
 		client("/live/clip/fire",[self.n,self.c],self.host,self.port).send()
@@ -166,9 +239,7 @@ class Clip:
 		client("/live/clip/stop",[self.n,self.c],self.host,self.port).send()
 		
 	def fpath(self):
-		client("/live/clip/get/file_path",[self.n,self.c],self.host,self.port).send()
-		time.sleep(cfg.TICK)
-		return(cfg.data[2])
+		return(query("/live/clip/get/file_path",[self.n,self.c],self.host,self.port)[2])
 	
 	def looping(self,mode='off'):
 		if mode == 'off':
@@ -182,13 +253,23 @@ class Clip:
 		if mode == 'on':
 			client("/live/clip/set/warping",[self.n,self.c,1],self.host,self.port).send()
 			
-	def dur(self):
-		client("/live/clip/get/file_path",[self.n,self.c],self.host,self.port).send()
-		time.sleep(cfg.TICK)
-		fil = cfg.data[2]
-		sr, wav = wavfile.read(fil)
-		nsamples = wav.size/wav.shape[1]
-		return(nsamples/sr)
+	def prefetch(self,fil=None):
+		# read and cache the duration of the clip (fil = file path, if already known)
+		if fil is None:
+			fil = self.fpath()
+		slot = (self.host,self.port,self.n,self.c)
+		dur = wavdur(fil)
+		_clippath[slot] = fil
+		_clipdur[slot+(fil,)] = (os.path.getmtime(fil),dur)
+		return(dur)
+		
+	def dur(self,refresh=False):
+		# cached per file path after the first call (or after session prefetch): no network
+		# access, and only a stat of the file to check that it was not rewritten
+		dur = None if refresh else _cachedur((self.host,self.port,self.n,self.c))
+		if dur is None:
+			dur = self.prefetch()
+		return(dur)
 	
 class ClipSlot:
 	
@@ -217,56 +298,44 @@ class Device:
 		self.host = host
 		
 	def name(self):
-		client("/live/device/get/name",[self.n,self.d],self.host,self.port).send()
-		time.sleep(cfg.TICK)
-		return(cfg.data[2])
+		return(query("/live/device/get/name",[self.n,self.d],self.host,self.port)[2])
 	
 	def num(self):
-		client("/live/device/get/num_parameters",[self.n,self.d],self.host,self.port).send()
-		time.sleep(cfg.TICK)
-		return(cfg.data[2])
+		return(query("/live/device/get/num_parameters",[self.n,self.d],self.host,self.port)[2])
 	
 	def max(self):
-		client("/live/device/get/parameters/max",[self.n,self.d],self.host,self.port).send()
-		time.sleep(cfg.TICK)
-		return(cfg.data[2])
+		return(query("/live/device/get/parameters/max",[self.n,self.d],self.host,self.port)[2])
 	
 	def min(self):
-		client("/live/device/get/parameters/min",[self.n,self.d],self.host,self.port).send()
-		time.sleep(cfg.TICK)
-		return(cfg.data[2])
+		return(query("/live/device/get/parameters/min",[self.n,self.d],self.host,self.port)[2])
 	
+	def parameters(self):
+		# names, values, min and max of all the parameters in one pipelined round-trip
+		res = queryAll([("/live/device/get/parameters/"+what,[self.n,self.d]) 
+						for what in ['name','value','min','max']],self.host,self.port)
+		assert None not in res, 'no reply from device {} on track {}'.format(self.d,self.n)
+		names,values,mins,maxs = [list(args[2:]) for args in res]
+		return(np.array(names),np.array(values,dtype=float),np.array(mins,dtype=float),np.array(maxs,dtype=float))
+		
 	def cntrldict(self,mode='get'):
 		if mode =='get':
-			client("/live/device/get/parameters/name",[self.n,self.d],self.host,self.port).send()
-			time.sleep(cfg.TICK)
-			keys = list(cfg.data[2:]).copy()
-			client("/live/device/get/parameters/value",[self.n,self.d],self.host,self.port).send()
-			time.sleep(cfg.TICK)
-			values = list(cfg.data[2:]).copy()
-			pardict = dict(zip(keys,values))
-			assert len(pardict) == self.num(),'duplicate keys - use cntrllist method instead'
+			keys,values,_,_ = self.parameters()
+			pardict = dict(zip(keys.tolist(),values.tolist()))
+			assert len(pardict) == len(keys),'duplicate keys - use cntrllist method instead'
 			return(pardict)
 		if mode =='set':
 			client("/live/device/set/parameters/value",[self.n,self.d]+list(self.cntr.values()),
 				self.host,self.port).send()
 			time.sleep(cfg.TICK)
 			
-	def cntrllist(self,mode='get'):
+	def cntrllist(self,mode='get',bounds=False):
+		# parameter names can repeat here (they are positional, not dictionary keys)
+		# bounds = True also returns the min and max arrays
 		if mode =='get':
-			keys = []
-			values = []
-			for n in range(self.num()):
-				time.sleep(cfg.TICK)
-				client("/live/device/get/parameter/name",[self.n,self.d,n],self.host,self.port).send()
-				time.sleep(cfg.TICK)
-				keys.append(cfg.data[3])
-			for n in range(self.num()):
-				time.sleep(cfg.TICK)
-				client("/live/device/get/parameter/value",[self.n,self.d,n],self.host,self.port).send()
-				time.sleep(cfg.TICK)
-				values.append(float(cfg.data[3]))
-			return(np.array(keys),np.array(values))
+			keys,values,mins,maxs = self.parameters()
+			if bounds:
+				return(keys,values,mins,maxs)
+			return(keys,values)
 		if mode =='set':
 			client("/live/device/set/parameters/value",[self.n,self.d]+self.cntr,
 				self.host,self.port).send()
@@ -274,13 +343,12 @@ class Device:
 			
 	def param(self,n,val=None,mode='name'):
 		if mode == 'name':
-			client("/live/device/get/parameter/name",[self.n,self.d,n],self.host,self.port).send()
-			time.sleep(cfg.TICK)
-			return(cfg.data[3])
+			return(query("/live/device/get/parameter/name",[self.n,self.d,n],self.host,self.port)[3])
 		if mode == 'get':
-			client("/live/device/get/parameter/value",[self.n,self.d,n],self.host,self.port).send()
-			time.sleep(cfg.TICK)
-			return(cfg.data[3])
+			val = state.get("/live/device/get/parameter/value",[self.n,self.d,n])
+			if val is not None:
+				return(val[0])
+			return(query("/live/device/get/parameter/value",[self.n,self.d,n],self.host,self.port)[3])
 		if mode == 'set':
 			client("/live/device/set/parameter/value",[self.n,self.d,n,val],self.host,self.port).send()
 			time.sleep(cfg.TICK)
\ No newline at end of file
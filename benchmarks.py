@@ -0,0 +1,324 @@
+#
+# msctools: my collection of composing and performing tools in python
+#
+# © 2023 Marco Buongiorno Nardelli
+#
+
+# benchmarks of the control layer - run them by hand, e.g.
+# python -c "import msctools.benchmarks as b; b.bench_client()"
+
+import asyncio, socket, time
+import numpy as np
+
+from pythonosc.udp_client import SimpleUDPClient
+from pythonosc.osc_bundle import OscBundle
+
+from .osctools import client, close_pool
+import msctools.cfg as cfg
+
+def _sink(host=cfg.HOST):
+	# local UDP socket that swallows the benchmark traffic
+	sock = socket.socket(socket.AF_INET,socket.SOCK_DGRAM)
+	sock.bind((host,0))
+	sock.setsockopt(socket.SOL_SOCKET,socket.SO_RCVBUF,1<<20)
+	return(sock,sock.getsockname()[1])
+
+def bench_client(nmsg=20000,host=cfg.HOST,verbose=True):
+	# messages/second of a one-socket-per-message client vs the pooled client, and of one
+	# SimpleUDPClient reused by hand (the floor of the cost of a send)
+	sock,port = _sink(host)
+	address = "/live/track/set/volume"
+	t0 = time.perf_counter()
+	for n in range(nmsg):
+		SimpleUDPClient(host,port).send_message(address,[0,0.85])
+	before = nmsg/(time.perf_counter()-t0)
+	udp = SimpleUDPClient(host,port)
+	t0 = time.perf_counter()
+	for n in range(nmsg):
+		udp.send_message(address,[0,0.85])
+	direct = nmsg/(time.perf_counter()-t0)
+	udp._sock.close()
+	close_pool()
+	t0 = time.perf_counter()
+	for n in range(nmsg):
+		client(address,[0,0.85],host,port).send()
+	after = nmsg/(time.perf_counter()-t0)
+	close_pool()
+	sock.close()
+	if verbose:
+		print('new client per message: {:10.0f} msg/s'.format(before))
+		print('reused SimpleUDPClient: {:10.0f} msg/s'.format(direct))
+		print('pooled client:          {:10.0f} msg/s'.format(after))
+	return(before,direct,after)
+
+def bench_session(verbose=True):
+	# full session scan, blocking session.setSession() vs asynctools.setSession()
+	# needs Live with AbletonOSC and a running osctools.server (the async scan shares its replies)
+	# the clip durations are not prefetched: the async scan does not read them either
+	from .session import setSession
+	from . import asynctools
+	t0 = time.perf_counter()
+	setSession(durations=False)
+	sync = time.perf_counter()-t0
+	async def scan():
+		tr = await asynctools.transport(listen=None).open()
+		try:
+			t0 = time.perf_counter()
+			await asynctools.setSession(transport=tr)
+			return(time.perf_counter()-t0)
+		finally:
+			tr.close()
+	asyn = asyncio.run(scan())
+	if verbose:
+		print('setSession sync:  {:8.3f} s'.format(sync))
+		print('setSession async: {:8.3f} s'.format(asyn))
+	return(sync,asyn)
+
+def bench_scheduler(ntasks=64,T=5.0,period=None,spin=None,verbose=True):
+	# ntasks periodic tasks (e.g. players polling cfg.stop every cfg.TICK) for T seconds:
+	# one thread per task sleeping with time.sleep, as the players did before the scheduler,
+	# vs a single event loop (spin = its busy wait, eventloop default if None), the same
+	# scheduled events in both cases - CPU usage, events per second and, per event, CPU time
+	# and thread wakeups
+	import threading
+	from .scheduler import eventloop
+	if period is None:
+		period = cfg.TICK
+	nstep = int(T/period)
+	steps = [0]
+	def ticker(offset):
+		yield offset
+		for n in range(nstep):
+			steps[0] += 1
+			yield period
+	def sleeper(gen):
+		for dt in gen:
+			time.sleep(dt)
+	cpu0 = time.process_time()
+	t0 = time.monotonic()
+	threads = [threading.Thread(target=sleeper,args=(ticker(n*period/ntasks),)) for n in range(ntasks)]
+	for th in threads:
+		th.start()
+	for th in threads:
+		th.join()
+	wall = time.monotonic()-t0
+	cpu = time.process_time()-cpu0
+	# each thread sleeps and wakes up once per event
+	threaded = {'cpu':cpu/wall,'events':steps[0]/wall,'cpu/event':cpu/max(steps[0],1),'wakeups/event':1.0}
+	steps[0] = 0
+	loop = eventloop() if spin is None else eventloop(spin)
+	cpu0 = time.process_time()
+	t0 = time.monotonic()
+	for n in range(ntasks):
+		loop.spawn(ticker(n*period/ntasks))
+	while steps[0] < ntasks*nstep and time.monotonic()-t0 < 2*T:
+		time.sleep(period)
+	wall = time.monotonic()-t0
+	cpu = time.process_time()-cpu0
+	wakeups = loop.wakeups
+	loop.stop()
+	single = {'cpu':cpu/wall,'events':steps[0]/wall,'cpu/event':cpu/max(steps[0],1),
+			'wakeups/event':wakeups/max(steps[0],1)}
+	if verbose:
+		for name,res in [('sleep threads:',threaded),('event loop:   ',single)]:
+			print('{} cpu {:6.1f} %  {:8.0f} events/s  {:8.1f} us cpu/event  {:6.3f} wakeups/event'.format(
+				name,100*res['cpu'],res['events'],1e6*res['cpu/event'],res['wakeups/event']))
+	return(threaded,single)
+
+def _receiver(conn,host):
+	# separate process (not competing for the GIL with the sender) that records the onsets:
+	# arrival time, or the timetag if later (as a receiver that honors timetags does)
+	sock,port = _sink(host)
+	sock.settimeout(0.5)
+	conn.send(port)
+	onsets = []
+	started = False
+	while True:
+		try:
+			data = sock.recv(65536)
+		except socket.timeout:
+			if started:
+				break
+			continue
+		started = True
+		now = time.monotonic()
+		if OscBundle.dgram_is_bundle(data):
+			tag = OscBundle(data).timestamp
+			onsets.append(max(now,now+tag-time.time()))
+		else:
+			onsets.append(now)
+	sock.close()
+	conn.send(onsets)
+
+def bench_lookahead(nevents=200,period=0.05,load=8,burn=0.002,lookahead=None,host=cfg.HOST,verbose=True):
+	# a periodic player, just in time vs timetagged bundles sent lookahead early, on an event
+	# loop loaded with other tasks (each busy for burn seconds every period)
+	# headline: the sender-side onsetStats, in particular the fraction of events sent later than
+	# lookahead after their deadline (past their onset when timetagged), which holds whatever the
+	# receiver. The onset jitter is measured at a simulated receiver that applies the timetags
+	# perfectly, so its improvement with timetags holds by construction: it says nothing about
+	# how SpatGRIS or Live schedule what they receive (Live ignores timetags)
+	import multiprocessing
+	from .scheduler import eventloop, sender
+	def player(out):
+		onset = time.monotonic()+period
+		for n in range(nevents):
+			yield out.wait(onset)
+			out.send("/live/clip/fire",[0,n])
+			onset += period
+	def busy():
+		while True:
+			t0 = time.perf_counter()
+			while time.perf_counter()-t0 < burn:
+				pass
+			yield period
+	results = {}
+	for mode in ['jit','timetags']:
+		conn,child = multiprocessing.Pipe()
+		rec = multiprocessing.Process(target=_receiver,args=(child,host))
+		rec.start()
+		port = conn.recv()
+		if mode == 'timetags':
+			cfg.TIMETAGS.append((host,port))
+		loop = eventloop()
+		for n in range(load):
+			loop.spawn(busy(),delay=n*period/load)
+		out = sender(host,port,lookahead)
+		loop.spawn(player(out))
+		time.sleep((nevents+2)*period+out.lookahead)
+		loop.stop()
+		onsets = conn.recv()
+		rec.join()
+		if mode == 'timetags':
+			cfg.TIMETAGS.remove((host,port))
+		dev = np.array(onsets)-period*np.arange(len(onsets))
+		dev -= dev.mean()
+		results[mode] = {'events':len(onsets),'std':dev.std(),'max':np.abs(dev).max(),'sender':out.stats(),
+						'lookahead':out.lookahead}
+	close_pool()
+	if verbose:
+		for mode,res in results.items():
+			st = res['sender']
+			print('{:9s} {:5d} events  late {:6.2f} % (lookahead {:.0f} ms)  onset error std {:7.3f} ms  max {:7.3f} ms'.format(
+				mode,st['events'],100*st['late'],1000*res['lookahead'],1000*st['std'],1000*st['max']))
+			print('{:9s} simulated receiver, jitter std {:7.3f} ms  max {:7.3f} ms'.format(
+				'',1000*res['std'],1000*res['max']))
+	return(results)
+
+def bench_postman(graphs=None,verbose=True):
+	# chinese_postman on the network generators used by the players: exact vs greedy matching,
+	# and the time the former one-Dijkstra-per-pair distance stage takes on the same graph
+	import itertools
+	import networkx as nx
+	from .networks import chinese_postman
+	if graphs is None:
+		graphs = [('barabasi_albert_graph',(100,2,1)),('barabasi_albert_graph',(400,2,1)),
+				('watts_strogatz_graph',(300,5,0.2,1)),('random_regular_graph',(3,200,1))]
+	results = []
+	for nxmodel,args in graphs:
+		Gx = getattr(nx,nxmodel)(*args)
+		odd = [node for node,degree in Gx.degree() if degree%2 == 1]
+		t0 = time.perf_counter()
+		for u,v in itertools.combinations(odd,2):
+			nx.dijkstra_path_length(Gx,u,v,'distance')
+		pairwise = time.perf_counter()-t0
+		t0 = time.perf_counter()
+		exact = len(chinese_postman(Gx))
+		texact = time.perf_counter()-t0
+		t0 = time.perf_counter()
+		greedy = len(chinese_postman(Gx,matching='greedy'))
+		tgreedy = time.perf_counter()-t0
+		results.append({'graph':nxmodel,'args':args,'odd':len(odd),'pairwise':pairwise,
+						'exact':texact,'greedy':tgreedy,'length':exact,'greedy_length':greedy})
+		if verbose:
+			print('{:24s} {:18s} {:5d} odd  pairwise distances {:7.3f} s  exact {:7.3f} s ({:d} edges)  greedy {:7.3f} s ({:d} edges)'.format(
+				nxmodel,str(args),len(odd),pairwise,texact,exact,tgreedy,greedy))
+	return(results)
+
+# import time budgets (seconds, cumulative as reported by python -X importtime)
+# bench_import(check=True) fails if a module goes over its budget, e.g. when a heavy
+# dependency is imported eagerly again
+IMPORT_BUDGET = {
+	'msctools': 0.05,
+	'msctools.base': 0.5,
+	'msctools.dictionaries': 0.05,
+	'msctools.session': 0.5,
+	'msctools.players': 1.0,
+}
+
+def bench_import(modules=None,check=True,verbose=True):
+	# import time of each module in a fresh interpreter with python -X importtime
+	import os, subprocess, sys
+	if modules is None:
+		modules = IMPORT_BUDGET
+	env = dict(os.environ,PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+	times = {}
+	for module in modules:
+		res = subprocess.run([sys.executable,'-X','importtime','-c','import '+module],
+							capture_output=True,text=True,env=env)
+		if res.returncode != 0:
+			times[module] = None
+			if verbose:
+				print('{:20s} import failed: {}'.format(module,res.stderr.strip().splitlines()[-1]))
+			continue
+		# "import time: self [us] | cumulative | imported package"
+		for line in res.stderr.splitlines():
+			fields = line.split('|')
+			if len(fields) == 3 and fields[2].strip() == module:
+				times[module] = int(fields[1])*1e-6
+		if verbose:
+			print('{:20s} {:8.3f} s  (budget {:.3f} s)'.format(module,times[module],IMPORT_BUDGET.get(module,float('nan'))))
+	if check:
+		over = {m:t for m,t in times.items() if t is not None and m in IMPORT_BUDGET and t > IMPORT_BUDGET[m]}
+		assert len(over) == 0, 'import time over budget: {}'.format(over)
+	return(times)
+
+def bench_trajectory(T=2.0,rate=None,cost=0.004,load=3,burn=0.004,verbose=True):
+	# wall-clock duration of a trajectory of T seconds on a loaded event loop (load tasks busy for
+	# burn seconds every rate, sends that take cost seconds): one send per step of the control
+	# rate as before vs envelopes.trajectory, which drops the late steps
+	from .scheduler import eventloop
+	from .envelopes import _trajectory, trajstats
+	if rate is None:
+		rate = cfg.CLOCK
+	def spin(dt):
+		t0 = time.perf_counter()
+		while time.perf_counter()-t0 < dt:
+			pass
+	def busy():
+		while True:
+			spin(burn)
+			yield rate
+	def fixed(st):
+		nt = int(T/rate)
+		st.start = time.monotonic()
+		for i in range(nt+1):
+			spin(cost)
+			st.record(cost)
+			st.end = time.monotonic()
+			if i < nt:
+				yield rate
+	def finished(gen,flag):
+		yield from gen
+		flag.append(True)
+	results = {}
+	for mode in ['fixed steps','trajectory']:
+		loop = eventloop()
+		for n in range(load):
+			loop.spawn(busy(),delay=n*rate/load)
+		st = trajstats(T,rate)
+		flag = []
+		if mode == 'fixed steps':
+			loop.spawn(finished(fixed(st),flag))
+		else:
+			loop.spawn(finished(_trajectory(lambda u: u,lambda pos: spin(cost),T,rate,st=st),flag))
+		t0 = time.monotonic()
+		while len(flag) == 0 and time.monotonic()-t0 < 4*T:
+			time.sleep(rate)
+		loop.stop()
+		results[mode] = st.stats()
+	if verbose:
+		for mode,res in results.items():
+			print('{:12s} T {:6.3f} s  duration {:7.3f} s  {:5d} steps  {:5d} dropped'.format(
+				mode,T,res['duration'],res['steps'],res['dropped']))
+	return(results)
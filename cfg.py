@@ -25,7 +25,16 @@ gain = [1.0]*NTRACK
 
 TICK = 0.15
 CLOCK = TICK/10
+TIMEOUT = TICK
+COALESCE = False
+FLUSH = CLOCK
+DELTA = False
+EPSILON = 1e-4
+LOOKAHEAD = 0.02
+SPIN = 0.0
+TIMETAGS = []
 PORT = 11000
+REPLY_PORT = 11001
 COMM_A = 18080
 COMM_B = 18081
 COMM_C = 18082
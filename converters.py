@@ -6,60 +6,66 @@
 
 import numpy as np
 
-def db2value(db):
-	# conversion from decibel to linear scale in track volume
-	if db <= 6 and db >= -18:
-		return (db+34)/40
-	elif db < -18 and db >= -41:
+# the volume conversions accept scalars or arrays (a whole envelope in one call):
+# the three branches of Live's volume curve are evaluated with masks, out of bounds values
+# are nan in arrays and None (with a message) for scalars
+
+def _db2value(db):
+	db = np.asarray(db,dtype=float)
+	val = np.full(db.shape,np.nan)
+	with np.errstate(invalid='ignore'):
+		lin = (db <= 6) & (db >= -18)
+		val[lin] = (db[lin]+34)/40
+		mid = (db < -18) & (db >= -41)
 		alpha = 799.503788
 		beta = 12630.61132
 		gamma = 201.871345
 		delta = 399.751894
-		return -(np.sqrt(-alpha*db - beta) - gamma) / delta
-	elif db < -41:
+		val[mid] = -(np.sqrt(-alpha*db[mid] - beta) - gamma) / delta
+		low = db < -41
 		alpha = 70.
 		beta = 118.426374
 		gamma = 7504./5567.
-		return np.power(((db+alpha)/beta),gamma)
-	else:
-		print('out of bounds')
-		
-def value2db(vl):
-	# conversion from linear to decibel scale in track volume
-	if vl <= 1 and vl >= 0.4:
-		return 40*vl -34
-	elif vl < 0.4 and vl >= 0.15:
+		val[low] = np.power(((db[low]+alpha)/beta),gamma)
+	return(val,~(lin | mid | low))
+
+def _value2db(vl):
+	vl = np.asarray(vl,dtype=float)
+	db = np.full(vl.shape,np.nan)
+	with np.errstate(invalid='ignore'):
+		lin = (vl <= 1) & (vl >= 0.4)
+		db[lin] = 40*vl[lin] -34
+		mid = (vl < 0.4) & (vl >= 0.15)
 		alpha = 799.503788
 		beta = 12630.61132
 		gamma = 201.871345
 		delta = 399.751894
-		return -((delta*vl - gamma)**2 + beta)/alpha
-	elif vl < 0.15:
+		db[mid] = -((delta*vl[mid] - gamma)**2 + beta)/alpha
+		low = vl < 0.15
 		alpha = 70.
 		beta = 118.426374
 		gamma = 7504./5567.
-		return beta*np.power(vl,1/gamma) - alpha
-	else:
+		db[low] = beta*np.power(vl[low],1/gamma) - alpha
+	return(db,~(lin | mid | low))
+
+def _result(val,out):
+	if np.any(out):
 		print('out of bounds')
+	if val.ndim == 0:
+		return(None if out else float(val))
+	return(val)
+
+def db2value(db):
+	# conversion from decibel to linear scale in track volume
+	return(_result(*_db2value(db)))
+		
+def value2db(vl):
+	# conversion from linear to decibel scale in track volume
+	return(_result(*_value2db(vl)))
 		
 def db4value(db):
 	# conversion from decibel to linear scale in clip gain
-	db -= 18
-	if db <= 6 and db >= -18:
-		return (db+34)/40
-	elif db < -18 and db >= -41:
-		alpha = 799.503788
-		beta = 12630.61132
-		gamma = 201.871345
-		delta = 399.751894
-		return -(np.sqrt(-alpha*db - beta) - gamma) / delta
-	elif db < -41:
-		alpha = 70.
-		beta = 118.426374
-		gamma = 7504./5567.
-		return np.power(((db+alpha)/beta),gamma)
-	else:
-		print('out of bounds')
+	return(_result(*_db2value(np.asarray(db,dtype=float)-18)))
 		
 def scale(val, src, dst):
 	"""
@@ -67,17 +73,25 @@ def scale(val, src, dst):
 	"""
 	return ((val - src[0]) / (src[1]-src[0])) * (dst[1]-dst[0]) + dst[0]
 
-def s2c(r,theta,phi):
+def s2c(r,theta=None,phi=None):
 	# spherical to cartesian conversion
 	# theta = azimuth in deg (counterclockwise ordering from 0)
 	# phi = elevation in deg (from 0 elevation)
+	# s2c(points) converts a whole trajectory: points = (N,3) array of (r,theta,phi) -> (N,3) array of (x,y,z)
+	if theta is None:
+		r,theta,phi = np.asarray(r,dtype=float).T
+		return(np.stack(s2c(r,theta,phi),axis=-1))
 	x = r * np.cos(np.radians(theta)) * np.sin(np.radians(90-phi))
 	y = r * np.sin(np.radians(theta)) * np.sin(np.radians(90-phi))
 	z = r * np.cos(np.radians(90-phi))
 	return(x,y,z)
 
-def c2s(x, y, z):
+def c2s(x, y=None, z=None):
 	# carthesian to spherical conversion
+	# c2s(points) converts a whole trajectory: points = (N,3) array of (x,y,z) -> (N,3) array of (r,theta,phi)
+	if y is None:
+		x,y,z = np.asarray(x,dtype=float).T
+		return(np.stack(c2s(x,y,z),axis=-1))
 	xy = np.sqrt(x**2 + y**2) # sqrt(x² + y²)
 	x_2 = x**2
 	y_2 = y**2
@@ -4,12 +4,34 @@
 # © 2023 Marco Buongiorno Nardelli
 #
 
-import threading
+import threading, inspect
 from functools import wraps
 
+from .scheduler import run, loop
+
 def threading_decorator(func):
     @wraps(func)
     def wrapper(*args):
         result = threading.Thread(target=func,args=args).start()
         return result
-    return wrapper
\ No newline at end of file
+    return wrapper
+
+def task(func):
+    # turns a generator function that yields waits (see scheduler.py) into a function that
+    # runs blocking when called, and adds .spawn(*args) to run it on the shared event loop
+    # the "track" argument, if any, labels the late-event statistics
+    sig = inspect.signature(func)
+    def track(args,kwargs):
+        try:
+            bound = sig.bind_partial(*args,**kwargs)
+        except TypeError:
+            return None
+        bound.apply_defaults()
+        return bound.arguments.get('track')
+    @wraps(func)
+    def wrapper(*args,**kwargs):
+        return run(func(*args,**kwargs),track(args,kwargs))
+    def spawn(*args,**kwargs):
+        return loop.spawn(func(*args,**kwargs),track(args,kwargs))
+    wrapper.spawn = spawn
+    return wrapper
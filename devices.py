@@ -6,9 +6,8 @@
 
 import time
 import numpy as np
-from scipy.io import wavfile
 
-from .osctools import client
+from .osctools import client, bundle, query
 from .converters import *
 import msctools.cfg as cfg
 
@@ -20,9 +19,8 @@ class Dolby:
 		self.cntr = controls
 		self.port = port
 		self.host = host
-		client("/live/device/get/name",[self.n,self.d],self.host,self.port).send()
-		time.sleep(cfg.TICK)
-		assert cfg.data[0] == 'Dolby Atmos Music Panner', 'wrong device!'
+		name = query("/live/device/get/name",[self.n,self.d],self.host,self.port)[2]
+		assert name == 'Dolby Atmos Music Panner', 'wrong device!'
 	
 	'''
 	Range is [0-1] for all parameters
@@ -73,42 +71,32 @@ class Dolby:
 			
 	def size(self,val=None,mode='get'):
 		if mode == 'get':
-			client("/live/device/get/parameter/value",[self.n,self.d,4],self.host,self.port).send()
-			time.sleep(cfg.TICK)
-			return(cfg.data[0])
+			return(query("/live/device/get/parameter/value",[self.n,self.d,4],self.host,self.port)[3])
 		if mode == 'set':
 			client("/live/device/set/parameter/value",[self.n,self.d,4,val],self.host,self.port).send()
 			time.sleep(cfg.TICK)
 	
 	def position(self,pos=[None,None,None],mode='get'):
 		if mode == 'get':
-			client("/live/device/get/parameter/value",[self.n,self.d,1],self.host,self.port).send()
-			time.sleep(cfg.TICK)
-			X = cfg.data[0]
-			client("/live/device/get/parameter/value",[self.n,self.d,2],self.host,self.port).send()
-			time.sleep(cfg.TICK)
-			Y = cfg.data[0]
-			client("/live/device/get/parameter/value",[self.n,self.d,3],self.host,self.port).send()
-			time.sleep(cfg.TICK)
-			Z = cfg.data[0]
+			X = query("/live/device/get/parameter/value",[self.n,self.d,1],self.host,self.port)[3]
+			Y = query("/live/device/get/parameter/value",[self.n,self.d,2],self.host,self.port)[3]
+			Z = query("/live/device/get/parameter/value",[self.n,self.d,3],self.host,self.port)[3]
 			return(X,Y,Z)
 		if mode == 'set':
 			X = pos[0]
 			Y = pos[1]
 			Z = pos[2]
-			client("/live/device/set/parameter/value",[self.n,self.d,1,X],self.host,self.port).send()
-			client("/live/device/set/parameter/value",[self.n,self.d,2,Y],self.host,self.port).send()
-			client("/live/device/set/parameter/value",[self.n,self.d,3,Z],self.host,self.port).send()
+			# the three coordinates land together in one bundle
+			with bundle(self.host,self.port) as b:
+				b.add("/live/device/set/parameter/value",[self.n,self.d,1,X])
+				b.add("/live/device/set/parameter/value",[self.n,self.d,2,Y])
+				b.add("/live/device/set/parameter/value",[self.n,self.d,3,Z])
 			
 	def param(self,n,val=None,mode='name'):
 		if mode == 'name':
-			client("/live/device/get/parameter/name",[self.n,self.d,n],self.host,self.port).send()
-			time.sleep(cfg.TICK)
-			return(cfg.data[0])
+			return(query("/live/device/get/parameter/name",[self.n,self.d,n],self.host,self.port)[3])
 		if mode == 'get':
-			client("/live/device/get/parameter/value",[self.n,self.d,n],self.host,self.port).send()
-			time.sleep(cfg.TICK)
-			return(cfg.data[0])
+			return(query("/live/device/get/parameter/value",[self.n,self.d,n],self.host,self.port)[3])
 		if mode == 'set':
 			client("/live/device/set/parameter/value",[self.n,self.d,n,val],self.host,self.port).send()
 			time.sleep(cfg.TICK)
@@ -122,9 +110,8 @@ class SpatControl:
 		self.cntr = controls
 		self.port = port
 		self.host = host
-		client("/live/device/get/name",[self.n,self.d],self.host,self.port).send()
-		time.sleep(cfg.TICK)
-		assert cfg.data[0] == 'ControlGris', 'wrong device!'
+		name = query("/live/device/get/name",[self.n,self.d],self.host,self.port)[2]
+		assert name == 'ControlGris', 'wrong device!'
 		
 	'''
 	Range is [0-1] for all parameters
@@ -143,51 +130,39 @@ class SpatControl:
 		
 	def azispan(self,val=None,mode='get'):
 		if mode == 'get':
-			client("/live/device/get/parameter/value",[self.n,self.d,7],self.host,self.port).send()
-			time.sleep(cfg.TICK)
-			return(cfg.data[0])
+			return(query("/live/device/get/parameter/value",[self.n,self.d,7],self.host,self.port)[3])
 		if mode == 'set':
 			client("/live/device/set/parameter/value",[self.n,self.d,7,val],self.host,self.port).send()
 			time.sleep(cfg.TICK)
 
 	def elespan(self,val=None,mode='get'):
 		if mode == 'get':
-			client("/live/device/get/parameter/value",[self.n,self.d,8],self.host,self.port).send()
-			time.sleep(cfg.TICK)
-			return(cfg.data[0])
+			return(query("/live/device/get/parameter/value",[self.n,self.d,8],self.host,self.port)[3])
 		if mode == 'set':
 			client("/live/device/set/parameter/value",[self.n,self.d,8,val],self.host,self.port).send()
 			time.sleep(cfg.TICK)
 			
 	def position(self,pos=[None,None,None],mode='get'):
 		if mode == 'get':
-			client("/live/device/get/parameter/value",[self.n,self.d,1],self.host,self.port).send()
-			time.sleep(cfg.TICK)
-			X = cfg.data[0]
-			client("/live/device/get/parameter/value",[self.n,self.d,2],self.host,self.port).send()
-			time.sleep(cfg.TICK)
-			Y = cfg.data[0]
-			client("/live/device/get/parameter/value",[self.n,self.d,3],self.host,self.port).send()
-			time.sleep(cfg.TICK)
-			Z = cfg.data[0]
+			X = query("/live/device/get/parameter/value",[self.n,self.d,1],self.host,self.port)[3]
+			Y = query("/live/device/get/parameter/value",[self.n,self.d,2],self.host,self.port)[3]
+			Z = query("/live/device/get/parameter/value",[self.n,self.d,3],self.host,self.port)[3]
 			return(X,Y,Z)
 		if mode == 'set':
 			X = pos[0]
 			Y = pos[1]
 			Z = pos[2]
-			client("/live/device/set/parameter/value",[self.n,self.d,1,X],self.host,self.port).send()
-			client("/live/device/set/parameter/value",[self.n,self.d,2,Y],self.host,self.port).send()
-			client("/live/device/set/parameter/value",[self.n,self.d,3,Z],self.host,self.port).send()
+			# the three coordinates land together in one bundle
+			with bundle(self.host,self.port) as b:
+				b.add("/live/device/set/parameter/value",[self.n,self.d,1,X])
+				b.add("/live/device/set/parameter/value",[self.n,self.d,2,Y])
+				b.add("/live/device/set/parameter/value",[self.n,self.d,3,Z])
 			
 	def param(self,n,val=None,mode='name'):
 		if mode == 'name':
-			client("/live/device/get/parameter/name",[self.n,self.d,n],self.host,self.port).send()
-			time.sleep(cfg.TICK)
-			return(cfg.data[0])
+			return(query("/live/device/get/parameter/name",[self.n,self.d,n],self.host,self.port)[3])
 		if mode == 'get':
-			client("/live/device/get/parameter/value",[self.n,self.d,n],self.host,self.port).send()
-			time.sleep(cfg.TICK)
-			return(cfg.data[0])
+			return(query("/live/device/get/parameter/value",[self.n,self.d,n],self.host,self.port)[3])
 		if mode == 'set':
 			client("/live/device/set/parameter/value",[self.n,self.d,n,val],self.host,self.port).send()
 			time.sleep(cfg.TICK)
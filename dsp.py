@@ -18,9 +18,12 @@ import subprocess
 import warnings
 
 from wave import open as open_wave
-from scipy.io import wavfile
 
-import matplotlib.pyplot as plt
+from .utils import lazy
+
+# plotting and wav i/o are imported on first use
+wavfile = lazy('scipy.io.wavfile')
+plt = lazy('matplotlib.pyplot')
 
 try:
     from IPython.display import Audio
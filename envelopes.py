@@ -4,15 +4,171 @@
 # © 2023 Marco Buongiorno Nardelli
 #
 
-import time
+import time, threading
 import numpy as np
 
 from .converters import *
-from .devices import Spat
+from .osctools import bundle, bundleSend, changes
+from .decorators import task
+from .scheduler import spawn, at
 import msctools.cfg as cfg
 
+# Dynamics and trajectories are tasks (see scheduler.py): blocking when called,
+# or run on the shared event loop with e.g. crescendo.spawn(tracks,[0,1],-40,0,10)
+# the dynamics are played by the envelope engine below, their tasks only wait for the end
+
 # Dynamics
+#
+# envelopes are compiled into a 2D array of track volumes (one row per track, one column per
+# step of the control rate cfg.CLOCK) and streamed by a single engine task on the shared event
+# loop: at each tick one bundle carries the values that changed since the previous tick.
+# Any number of envelopes play concurrently in the same engine, and where two of them share
+# a track the one started last wins
+
+def volumes(tracklist,values):
+	# set the volume (decimal) of all tracks in tracklist with a single bundle
+	if not isinstance(values,(list,tuple,np.ndarray)):
+		values = [values]*len(tracklist)
+	bundleSend([("/live/track/set/volume",[tr.n,float(V)],tr.host,tr.port) 
+		for tr,V in zip(tracklist,values)])
+	for tr,V in zip(tracklist,values):
+		changes.note("/live/track/set/volume",[tr.n,float(V)],tr.host,tr.port)
+
+def curve(Vini,Vend,T,shape='db',rate=None):
+	# volumes (decimal) of a transition from Vini to Vend (dB) in T seconds at the control rate
+	# shape = 'linear' : linear in fader value
+	#		  'db'	   : linear in dB
+	#		  'power'  : linear in power (equal-power fades)
+	#		  array    : custom curve from 0 (Vini) to 1 (Vend) in dB, resampled to the control rate
+	if rate is None:
+		rate = cfg.CLOCK
+	nt = max(int(T/rate),1)
+	t = np.linspace(0.0,1.0,nt+1)
+	if isinstance(shape,str):
+		if shape == 'linear':
+			return(db2value(Vini)+(db2value(Vend)-db2value(Vini))*t)
+		if shape == 'db':
+			return(db2value(Vini+(Vend-Vini)*t))
+		if shape == 'power':
+			P = 10**(Vini/10)+(10**(Vend/10)-10**(Vini/10))*t
+			with np.errstate(divide='ignore'):
+				return(db2value(np.maximum(10*np.log10(P),-70.0)))
+		raise ValueError('unknown envelope shape: '+shape)
+	shape = np.asarray(shape,dtype=float)
+	frac = np.interp(t,np.linspace(0.0,1.0,len(shape)),shape)
+	return(db2value(Vini+(Vend-Vini)*frac))
+
+class envelope:
+	'''
+	Track volumes (decimal) at the control rate: values[i,k] = volume of tracklist[i] at step k
+	a 1D array of values is applied to all the tracks
+	'''
+	def __init__(self,tracklist,values,rate=None):
+		self.tracks = list(tracklist)
+		values = np.asarray(values,dtype=float)
+		if values.ndim == 1:
+			values = np.tile(values,(len(self.tracks),1))
+		assert values.shape[0] == len(self.tracks), 'one row of values per track'
+		self.values = values
+		self.rate = cfg.CLOCK if rate is None else rate
+		self.done = False
+		
+	def __len__(self):
+		return(self.values.shape[1])
+	
+	def duration(self):
+		return((len(self)-1)*self.rate)
+	
+	def resample(self,rate):
+		# same envelope at another control rate
+		t = np.arange(len(self))*self.rate
+		tn = np.arange(int(self.duration()/rate)+1)*rate
+		return(envelope(self.tracks,[np.interp(tn,t,row) for row in self.values],rate))
+	
+def transition(tracklist,Vini,Vend,T,shape='db',rate=None):
+	# envelope of the same transition on all the tracks of tracklist
+	return(envelope(tracklist,curve(Vini,Vend,T,shape,rate),rate))
 
+class engine:
+	
+	# unchanged volumes are skipped by the shared delta filter (osctools.changes, always on
+	# here): changes.configure("/live/track/set/volume",epsilon=...) sets the threshold and
+	# changes.reset() sends everything again (e.g. after the volumes were changed from Live)
+	
+	def __init__(self,rate=None):
+		self.rate = cfg.CLOCK if rate is None else rate
+		self.active = []
+		self.lock = threading.Lock()
+		self.task = None
+		self.ticks = 0
+		self.sent = 0
+		self.skipped = 0
+		
+	def play(self,env):
+		# start env at the next tick (right away if the engine is idle)
+		if env.rate != self.rate:
+			env = env.resample(self.rate)
+		env.done = False
+		with self.lock:
+			self.active.append([env,0])
+			if self.task is None:
+				self.task = spawn(self._run())
+		return(env)
+	
+	def stop(self,env=None):
+		# stop env (all the envelopes if None) where it is
+		with self.lock:
+			for item in list(self.active):
+				if env is None or item[0] is env:
+					item[0].done = True
+					self.active.remove(item)
+					
+	def _run(self):
+		finished = False
+		try:
+			while True:
+				targets = {}
+				with self.lock:
+					if len(self.active) == 0:
+						self.task = None
+						finished = True
+						return
+					for item in self.active:
+						env,k = item
+						for tr,V in zip(env.tracks,env.values[:,k]):
+							targets[(tr.host,tr.port,tr.n)] = (tr,V)
+						item[1] += 1
+					for item in [item for item in self.active if item[1] >= len(item[0])]:
+						item[0].done = True
+						self.active.remove(item)
+				messages = []
+				for tr,V in targets.values():
+					values = changes.filter("/live/track/set/volume",[tr.n,float(V)],tr.host,tr.port)
+					if values is None:
+						self.skipped += 1
+						continue
+					messages.append(("/live/track/set/volume",values,tr.host,tr.port))
+				if len(messages) > 0:
+					bundleSend(messages,delta=False)
+					self.sent += len(messages)
+				self.ticks += 1
+				yield self.rate
+		finally:
+			if not finished:
+				# raised, cancelled or dropped by a stopped loop: the envelopes in play are lost,
+				# the next play() starts a new task
+				with self.lock:
+					for item in self.active:
+						item[0].done = True
+					self.active = []
+					self.task = None
+			
+	def stats(self):
+		return({'envelopes':len(self.active),'ticks':self.ticks,'sent':self.sent,'skipped':self.skipped})
+
+dynamics = engine()
+
+@task
 def multiEnvLive(tracklist,T,omega=None):
 
 	# general function that builds the envelope series for each individual channel
@@ -29,7 +185,7 @@ def multiEnvLive(tracklist,T,omega=None):
 	nch = len(Om)-1
 	if nch == 1:
 		# trivial single channel case
-		env = [np.ones(T)]
+		env = [np.ones(int(T//cfg.CLOCK))]
 	else:
 		# 2 or more channels
 		sections = [0]
@@ -53,159 +209,342 @@ def multiEnvLive(tracklist,T,omega=None):
 			env[n][x < zerodown] = 0
 			env[n][x > zeroflat] = 0
 	env = scale(np.array(env),[0.0,1.0],[0.0,0.85])
-	for i in range(len(x)):
-		for n,tr in enumerate(tracklist):
-			tr.volume(env[n][i],mode='set')
-		time.sleep(cfg.CLOCK)
+	# played by the envelope engine, the task just waits for the end
+	env = dynamics.play(envelope(tracklist,env))
+	yield env.duration()+cfg.CLOCK
 
-def crescendo(tracks,tracklist,Vini,Vend,T):
+@task
+def crescendo(tracks,tracklist,Vini,Vend,T,shape='linear'):
 	assert type(tracklist) == list, 'must be a list of tracks'
 	# input volumes in dB, time in seconds
-	# set initial volume (decimal)
-	Vini = db2value(Vini)
-	Vend = db2value(Vend)
+	# shape of the transition: see curve()
 	assert Vini <= Vend
-	for tr in tracklist:
-		tracks[tr].volume(Vini,mode='set')
-	nt = int(T/cfg.CLOCK)
-	dV = (Vend - Vini)/nt
-	V = Vini
-	for t in range(nt):
-		time.sleep(cfg.CLOCK)
-		V += dV
-		for tr in tracklist:
-			tracks[tr].volume(V,mode='set')
-	for tr in tracklist:
-		tracks[tr].volume(Vend,mode='set')
+	env = dynamics.play(transition([tracks[tr] for tr in tracklist],Vini,Vend,T,shape))
+	yield env.duration()+cfg.CLOCK
 		
-def decrescendo(tracks,tracklist,Vini,Vend,T):
+@task
+def decrescendo(tracks,tracklist,Vini,Vend,T,shape='linear'):
 	assert type(tracklist) == list, 'must be a list of tracks'
 	# input volumes in dB, time in seconds
-	# set initial volume (decimal)
-	Vini = db2value(Vini)
-	Vend = db2value(Vend)
+	# shape of the transition: see curve()
 	assert Vini >= Vend
-	for tr in tracklist:
-		tracks[tr].volume(Vini,mode='set')
-	nt = int(T/cfg.CLOCK)
-	dV = (Vini - Vend)/nt
-	V = Vini
-	for t in range(nt):
-		time.sleep(cfg.CLOCK)
-		V -= dV
-		for tr in tracklist:
-			tracks[tr].volume(V,mode='set')
-	for tr in tracklist:
-		tracks[tr].volume(Vend,mode='set')
+	env = dynamics.play(transition([tracks[tr] for tr in tracklist],Vini,Vend,T,shape))
+	yield env.duration()+cfg.CLOCK
 		
 def setVol(tracks,tracklist,V):
 	assert type(tracklist) == list, 'must be a list of tracks'
 	# input volumes in dB, time in seconds
 	# set volume (decimal)
 	V = db2value(V)
-	for tr in tracklist:
-		tracks[tr].volume(V,mode='set')
+	volumes([tracks[tr] for tr in tracklist],V)
 		
-# Position (generic device)
+# Position
+#
+# a trajectory is a function of u = 0..1 (fraction of its duration T) sampled by trajectory()
+# on absolute deadlines at the control rate. Each step samples the function at the time it is
+# actually sent, and the steps whose deadline has already passed are dropped, so a slow send
+# or a loaded machine costs resolution but never time: the last position goes out at T
+
+# statistics of the trajectories by source
+trajectories = {}
+
+class trajstats:
+	
+	def __init__(self,T,rate):
+		self.T = T
+		self.rate = rate
+		self.steps = 0
+		self.dropped = 0
+		self.cost = 0.0
+		self.maxcost = 0.0
+		self.start = None
+		self.end = None
+		
+	def record(self,cost):
+		self.steps += 1
+		self.cost += cost
+		self.maxcost = max(self.maxcost,cost)
 		
+	def stats(self):
+		return({'T':self.T,'duration':self.end-self.start if self.end is not None else None,
+				'steps':self.steps,'dropped':self.dropped,
+				'cost':self.cost/max(self.steps,1),'maxcost':self.maxcost})
+
+def trajectoryStats(verbose=True):
+	stats = {source:st.stats() for source,st in trajectories.items()}
+	if verbose:
+		for source,st in sorted(stats.items()):
+			print('source {:3d}: T {:7.3f} s  duration {:7.3f} s  {:6d} steps  {:5d} dropped  send {:7.3f} ms  max {:7.3f} ms'.format(
+				source,st['T'],st['duration'] or 0.0,st['steps'],st['dropped'],1000*st['cost'],1000*st['maxcost']))
+	return(stats)
+
+def _trajectory(func,send,T,rate=None,source=None,st=None):
+	# func(u) = position at the fraction u of T, send(position) delivers it
+	# source = index in cfg.stop_source to stop it and in trajectories for the statistics
+	if rate is None:
+		rate = cfg.CLOCK
+	if st is None:
+		st = trajstats(T,rate)
+	if source is not None:
+		trajectories[source] = st
+	start = time.monotonic()
+	st.start = start
+	if T <= 0:
+		# nothing to sample: straight to the end position
+		send(func(1.0))
+		st.record(time.monotonic()-start)
+		st.end = start
+		return
+	nt = max(int(round(T/rate)),1)
+	k = 0
+	while True:
+		now = time.monotonic()
+		u = 1.0 if k == nt else min((now-start)/T,1.0)
+		send(func(u))
+		done = time.monotonic()
+		st.record(done-now)
+		st.end = now
+		if k == nt or (source is not None and cfg.stop_source[source]):
+			break
+		# next step whose deadline is still ahead (the last one always at T)
+		nxt = min(max(k+1,int(np.ceil((done-start)/rate))),nt)
+		st.dropped += nxt-k-1
+		k = nxt
+		yield at(start+min(k*rate,T))
+
+trajectory = task(_trajectory)
+
+def _polyline(points):
+	# piecewise linear path through points (equal time per segment), as a function of u = 0..1
+	points = np.asarray(points,dtype=float)
+	nseg = len(points)-1
+	def func(u):
+		x = u*nseg
+		i = min(int(x),nseg-1)
+		return(points[i]+(x-i)*(points[i+1]-points[i]))
+	return(func)
+
+def _arc(aziA,aziB,radius,yscale=1.0):
+	# arc of circle from azimuth aziA to aziB (degrees, clockwise from y) in the horizontal plane
+	def func(u):
+		d = aziA+(aziB-aziA)*u
+		return(radius*np.cos(-d*np.pi/180+np.pi/2),yscale*radius*np.sin(-d*np.pi/180+np.pi/2),0.0)
+	return(func)
+
+def _sender(device,*args):
+	# ControlGris in Live (position) or SpatGris (car)
+	if hasattr(device,'position'):
+		return(lambda pos: device.position(list(pos),mode='set'))
+	return(lambda pos: device.car(pos[0],pos[1],pos[2],*args))
+
+@task
 def lines(source,device,posA,posB,T,cycle=1,*args):
-	# Draws a line between posA and posB in time T
+	# Draws a line between posA and posB in time T, back and forth cycle times
 	# to be used in source placement
 	assert type(posA) == list, 'posA is a point in 3D space'
 	assert type(posB) == list, 'posA is a point in 3D space'
-	nt = int(T/cfg.CLOCK)
-	# Formula to correct for the delay in the Spat OSC messaging server (empirical!!!)
-	wait = (T-0.0028*nt)/nt
-	X = np.linspace(posA[0],posB[0],nt)
-	Y = np.linspace(posA[1],posB[1],nt)
-	Z = np.linspace(posA[2],posB[2],nt)
-	for c in range(cycle):
-		for i in range(nt):
-			try:
-				device.position([X[i*(-1)**c],Y[i*(-1)**c],Z[i*(-1)**c]],mode='set')
-				time.sleep(cfg.CLOCK)
-			except:
-				# for SpatGris
-				device.car(X[i*(-1)**c],Y[i*(-1)**c],Z[i*(-1)**c],*args)
-				time.sleep(wait)
-			if cfg.stop_source[source]: break
+	points = [posA if c%2 == 0 else posB for c in range(cycle+1)]
+	yield from _trajectory(_polyline(points),_sender(device,*args),T*cycle,source=source)
 			
+@task
 def lineCycle(source,device,X0,Y0,Z0,T,cycle=1,dir='r',*args):
 	# Spans the whole range [-1.0,1.0] starting from an arbitrary position in time T
 	# to be used in source placement - dir='r' starts movement in r direction ('l' for left)
 	# version for MEET - change only X coordinate
-	if dir == 'r':
-		c0 = 0
-	else:
-		c0 = 1
-	nt = int(T/cfg.CLOCK)
-	nt0 = int((X0+1)/2*nt)
-	# Formula to correct for the delay in the Spat OSC messaging server (empirical!!!)
-	wait = (T-0.0028*nt)/nt
-	X = np.linspace(-1,1,nt)
-	Y = np.linspace(Y0,Y0,nt)
-	Z = np.linspace(Z0,Z0,nt)
-	if dir == 'r':
-		for i in range(nt0,nt):
-			device.car(X[i*(-1)**c0],Y[i*(-1)**c0],Z[i*(-1)**c0],*args)
-			time.sleep(wait)
-			if cfg.stop_source[source]: break
-	else:
-		for i in range(nt0)[::-1]:
-			device.car(X[i],Y[i],Z[i],*args)
-			time.sleep(wait)
-			if cfg.stop_source[source]: break
-	if c0 == 1: cycle += 1
-	for c in range((c0+1),cycle):
-		for i in range(nt):
-			device.car(X[i*(-1)**c],Y[i*(-1)**c],Z[i*(-1)**c],*args)
-			time.sleep(wait)
-			if cfg.stop_source[source]: break
-		if cfg.stop_source[source]: break
+	ends = [1.0,-1.0] if dir == 'r' else [-1.0,1.0]
+	X = [X0]+[ends[c%2] for c in range(cycle)]
+	# the first (partial) segment takes the fraction of T of its length
+	first = abs(X[1]-X0)/2*T
+	def func(u):
+		t = u*(first+(cycle-1)*T)
+		if u >= 1.0 or t >= first+(cycle-1)*T:
+			# also the zero length sweeps (T = 0, or cycle = 1 from the end)
+			x = X[-1]
+		elif t < first:
+			x = X0+(X[1]-X0)*t/first
+		else:
+			c = min(int((t-first)/T),cycle-2)
+			x = X[c+1]+(X[c+2]-X[c+1])*((t-first)/T-c)
+		return(x,Y0,Z0)
+	send = lambda pos: device.car(pos[0],pos[1],pos[2],*args)
+	yield from _trajectory(func,send,first+(cycle-1)*T,source=source)
 
+@task
 def circles(device,aziA,aziB,radius,T):
-	narc = np.abs(aziB-aziA)
-	sign = np.sign(aziB-aziA)
-	nt = int(T/cfg.CLOCK)
-	ddeg = narc/nt
-	d = aziA
-	for i in range(nt+1):
-		x = radius*np.cos(-i*np.pi/180+np.pi/2)
-		y = radius*np.sin(-i*np.pi/180+np.pi/2)/2
-		z = 0.0
-		device.position([x,y,z],mode='set')
-		d += sign*ddeg
-		time.sleep (cfg.CLOCK)
-		device.position([x,y,z],mode='set')
+	# arc from aziA to aziB (the y axis is scaled by 1/2)
+	yield from _trajectory(_arc(aziA,aziB,radius,0.5),_sender(device),T)
 		
+@task
+def follow(path,device,source=None,cycles=1,*args):
+	# play a keyframes path (or any function of u = 0..1 with a duration) on a device:
+	# Dolby, SpatControl (position) or Spat (car, *args = azispan, elespan), cycles times in a row
+	T = path.duration()
+	func = lambda u: path(np.mod(u*cycles,1.0) if u < 1.0 else 1.0)
+	yield from _trajectory(func,_sender(device,*args),T*cycles,source=source)
+
 # SpatGris control source position/envelopes
+#
+# the moving sources are owned by one driver: positions of all the sources in one array,
+# advanced together at each tick of the control rate by a single task on the shared event
+# loop, and the sources that changed sent as one bundle of /spat/serv messages
 
+class spatdriver:
+	
+	# the positions of the sources that did not move are skipped by the shared delta filter
+	# (osctools.changes, always on here, threshold set with changes.configure("/spat/serv",...))
+	
+	def __init__(self,host="127.0.0.1",port=18032,rate=None,nsource=cfg.NSOURCE):
+		self.host = host
+		self.port = port
+		self.rate = cfg.CLOCK if rate is None else rate
+		# per source: motion (0 = none, 1 = line, 2 = arc), 'deg' messages instead of 'car',
+		# start/end (A,B: points for lines, azimuth in A[:,0],B[:,0] for arcs), radius, start time, duration
+		self.mode = np.zeros(nsource,dtype=int)
+		self.deg = np.zeros(nsource,dtype=bool)
+		self.A = np.zeros((nsource,3))
+		self.B = np.zeros((nsource,3))
+		self.radius = np.ones(nsource)
+		self.t0 = np.zeros(nsource)
+		self.T = np.ones(nsource)
+		# current position (x,y,z or azi,ele,radius) and spans
+		self.pos = np.zeros((nsource,3))
+		self.span = np.zeros((nsource,2))
+		self.used = np.zeros(nsource,dtype=bool)
+		self.lock = threading.Lock()
+		self.task = None
+		self.ticks = 0
+		self.messages = 0
+		self.maxmessages = 0
+		self.cost = 0.0
+		self.maxcost = 0.0
+		self.overruns = 0
+		
+	def _motion(self,sources,mode,A,B,T,span,deg,radius=None):
+		sources = np.atleast_1d(sources)
+		with self.lock:
+			if radius is not None:
+				self.radius[sources] = radius
+			self.mode[sources] = mode
+			self.deg[sources] = deg
+			self.A[sources] = A
+			self.B[sources] = B
+			self.t0[sources] = time.monotonic()
+			self.T[sources] = max(T,1e-9)
+			self.span[sources] = span
+			self.used[sources] = True
+			if self.task is None:
+				self.task = spawn(self._run())
+				
+	def line(self,sources,A,B,T,span=(0.0,0.0)):
+		# move sources from A to B (cartesian, one point or one per source) in T seconds
+		self._motion(sources,1,A,B,T,span,False)
+		
+	def arc(self,sources,aziA,aziB,radius,T,span=(0.0,0.0),deg=False):
+		# move sources along an arc from azimuth aziA to aziB (degrees) in T seconds
+		# deg = True sends polar coordinates (azimuth, elevation 0, radius)
+		sources = np.atleast_1d(sources)
+		A = np.zeros((len(sources),3))
+		B = np.zeros((len(sources),3))
+		A[:,0] = aziA
+		B[:,0] = aziB
+		self._motion(sources,2,A,B,T,span,deg,radius)
+		
+	def place(self,sources,pos,span=(0.0,0.0)):
+		# set sources at pos (cartesian) at the next tick
+		self._motion(sources,1,pos,pos,0.0,span,False)
+		
+	def stop(self,sources=None):
+		# stop the motion of sources (all if None) where they are
+		with self.lock:
+			if sources is None:
+				self.mode[:] = 0
+			else:
+				self.mode[np.atleast_1d(sources)] = 0
+				
+	def moving(self,sources):
+		return(bool(np.any(self.mode[np.atleast_1d(sources)] > 0)))
+	
+	def _run(self):
+		finished = False
+		try:
+			while True:
+				t0 = time.perf_counter()
+				with self.lock:
+					active = (self.mode > 0) & ~cfg.stop_source[:len(self.mode)]
+					if not np.any(active):
+						self.mode[:] = 0
+						self.task = None
+						finished = True
+						return
+					u = np.clip((time.monotonic()-self.t0)/self.T,0.0,1.0)
+					ln = active & (self.mode == 1)
+					self.pos[ln] = self.A[ln]+u[ln,None]*(self.B[ln]-self.A[ln])
+					ar = active & (self.mode == 2)
+					d = self.A[:,0]+u*(self.B[:,0]-self.A[:,0])
+					car = ar & ~self.deg
+					self.pos[car,0] = self.radius[car]*np.cos(-d[car]*np.pi/180+np.pi/2)
+					self.pos[car,1] = self.radius[car]*np.sin(-d[car]*np.pi/180+np.pi/2)
+					self.pos[car,2] = 0.0
+					pol = ar & self.deg
+					self.pos[pol,0] = d[pol]
+					self.pos[pol,1] = 0.0
+					self.pos[pol,2] = self.radius[pol]
+					self.mode[active & (u >= 1.0)] = 0
+					self.mode[cfg.stop_source[:len(self.mode)]] = 0
+					idx = np.nonzero(self.used)[0]
+					deg = self.deg[idx]
+					values = np.hstack((self.pos,self.span))[idx].tolist()
+				b = bundle(self.host,self.port,delta=False)
+				sent = 0
+				for s,pol,val in zip(idx.tolist(),deg.tolist(),values):
+					val = changes.filter("/spat/serv",['deg' if pol else 'car',s]+val,self.host,self.port)
+					if val is not None:
+						b.add("/spat/serv",val)
+						sent += 1
+				b.send()
+				cost = time.perf_counter()-t0
+				self.ticks += 1
+				self.messages += sent
+				self.maxmessages = max(self.maxmessages,sent)
+				self.cost += cost
+				self.maxcost = max(self.maxcost,cost)
+				if cost > self.rate:
+					self.overruns += 1
+				yield self.rate
+		finally:
+			if not finished:
+				# raised, cancelled or dropped by a stopped loop: the sources stop where they
+				# are, the next motion starts a new task
+				with self.lock:
+					self.mode[:] = 0
+					self.task = None
+			
+	def budget(self,verbose=True):
+		# per tick: sources sent and time spent (compute + send) against the control rate
+		n = max(self.ticks,1)
+		report = {'ticks':self.ticks,'messages':self.messages/n,'maxmessages':self.maxmessages,
+				'cost':self.cost/n,'maxcost':self.maxcost,'load':self.cost/n/self.rate,'overruns':self.overruns}
+		if verbose:
+			print('{:d} ticks  {:.1f} sources/tick (max {:d})  {:.3f} ms/tick (max {:.3f} ms)  {:.1f} % of {:.0f} ms  {:d} overruns'.format(
+				report['ticks'],report['messages'],report['maxmessages'],1000*report['cost'],1000*report['maxcost'],
+				100*report['load'],1000*self.rate,report['overruns']))
+		return(report)
+
+swarm = spatdriver()
+
+def _follow(source,T):
+	# wait for the end of the motion of source, returning early if it is stopped (cfg.stop_source)
+	end = time.monotonic()+T+swarm.rate
+	while swarm.moving(source) and time.monotonic() < end:
+		yield swarm.rate
+
+@task
 def circlesCar(source,aziA,aziB,radius,T,*args):
-	narc = np.abs(aziB-aziA)
-	sign = np.sign(aziB-aziA)
-	nt = int(T/cfg.CLOCK)
-	ddeg = narc/nt
-	d = aziA
-	for i in range(nt+1):
-		if cfg.stop_source[source]:
-			break
-		x = radius*np.cos(-d*np.pi/180+np.pi/2)
-		y = radius*np.sin(-d*np.pi/180+np.pi/2)
-		z = 0.0
-		Spat(source).car(x,y,z,*args)
-		d += sign*ddeg
-		time.sleep (cfg.CLOCK)
+	# moved by the shared driver together with all the other sources, the task waits for the end
+	swarm.arc(source,aziA,aziB,radius,T,span=args[:2] if len(args) >= 2 else (0.0,0.0))
+	yield from _follow(source,T)
 
+@task
 def circlesDeg(source,aziA,aziB,T,*args):
-	narc = np.abs(aziB-aziA)
-	sign = np.sign(aziB-aziA)
-	nt = int(T/cfg.CLOCK)
-	ddeg = narc/nt
-	d = aziA
-	for i in range(nt+1):
-		if cfg.stop_source[source]:
-			break
-		Spat(source).deg(d,0.0,1.0,*args)
-		d += sign*ddeg
-		time.sleep(cfg.CLOCK)
-		
\ No newline at end of file
+	swarm.arc(source,aziA,aziB,1.0,T,span=args[:2] if len(args) >= 2 else (0.0,0.0),deg=True)
+	yield from _follow(source,T)
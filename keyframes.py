@@ -0,0 +1,107 @@
+#
+# msctools: my collection of composing and performing tools in python
+#
+# © 2023 Marco Buongiorno Nardelli
+#
+
+# keyframed trajectories
+#
+# a path is stored as its keyframes only and evaluated when needed, at a time t or
+# vectorized over an array of times, so a long or looping trajectory costs O(keyframes)
+# memory, e.g.
+#	p = keyframes([0,2,4,6],[[0,1,0],[1,0,0],[0,-1,0],[-1,0,0]],interp='catmullrom')
+#	p.at(1.5)						# position at t = 1.5 s
+#	p.at(np.linspace(0,6,100))		# (100,3) array
+#	follow(p,Spat(1),cycles=4)		# any device, see envelopes.follow
+
+import numpy as np
+
+from .converters import s2c, c2s
+
+class keyframes:
+	'''
+	Trajectory through keyframes (times in seconds, positions)
+	interp = 'linear', 'catmullrom' or 'bezier' - one for all the segments or a list, one per segment
+	handles = Bezier control points, array (nsegments,2,3): two per segment (Catmull-Rom tangents if None)
+	coords = 'car' : keyframes and interpolation in cartesian coordinates (x,y,z)
+	coords = 'sph' : keyframes and interpolation in spherical coordinates (radius, azimuth, elevation in deg)
+	output = coordinates of the positions returned: 'car' or 'sph'
+	loop = True    : closed path (last keyframe = first), the time wraps around the duration
+	'''
+	KINDS = {'linear':0,'catmullrom':1,'bezier':2}
+
+	def __init__(self,times,points,interp='catmullrom',handles=None,coords='car',output='car',loop=False):
+		self.times = np.asarray(times,dtype=float)
+		self.points = np.asarray(points,dtype=float)
+		assert self.points.ndim == 2 and self.points.shape[1] == 3, 'points are (x,y,z) or (r,azi,ele)'
+		assert len(self.times) == len(self.points) and len(self.times) >= 2, 'one time per keyframe, at least two'
+		assert np.all(np.diff(self.times) > 0), 'keyframe times must increase'
+		nseg = len(self.times)-1
+		if isinstance(interp,str):
+			interp = [interp]*nseg
+		assert len(interp) == nseg, 'one interpolation per segment'
+		self.kinds = np.array([self.KINDS[k] for k in interp])
+		self.coords = coords
+		self.output = output
+		self.loop = loop
+		P0,P1,P2,P3 = self._neighbours(np.arange(nseg))
+		if handles is None:
+			# the Bezier curve with these handles is the Catmull-Rom spline
+			self.handles = np.stack((P1+(P2-P0)/6,P2-(P3-P1)/6),axis=1)
+		else:
+			self.handles = np.asarray(handles,dtype=float)
+			assert self.handles.shape == (nseg,2,3), 'two Bezier handles per segment'
+
+	def duration(self):
+		return(self.times[-1]-self.times[0])
+
+	def _neighbours(self,seg):
+		# keyframes before, at the start, at the end and after each segment
+		n = len(self.points)
+		if self.loop:
+			# last keyframe = first: step over it when wrapping around
+			before = np.where(seg-1 < 0,n-2,seg-1)
+			after = np.where(seg+2 > n-1,1,seg+2)
+		else:
+			before = np.maximum(seg-1,0)
+			after = np.minimum(seg+2,n-1)
+		return(self.points[before],self.points[seg],self.points[seg+1],self.points[after])
+
+	def at(self,t):
+		# position(s) at time t (scalar or array), clamped to the ends or wrapped if loop
+		scalar = np.ndim(t) == 0
+		t = np.atleast_1d(np.asarray(t,dtype=float))
+		if self.loop:
+			t = self.times[0]+np.mod(t-self.times[0],self.duration())
+		else:
+			t = np.clip(t,self.times[0],self.times[-1])
+		seg = np.clip(np.searchsorted(self.times,t,side='right')-1,0,len(self.times)-2)
+		s = ((t-self.times[seg])/(self.times[seg+1]-self.times[seg]))[:,None]
+		P0,P1,P2,P3 = self._neighbours(seg)
+		kind = self.kinds[seg][:,None]
+		linear = P1+s*(P2-P1)
+		catmullrom = 0.5*(2*P1+(P2-P0)*s+(2*P0-5*P1+4*P2-P3)*s**2+(3*P1-P0-3*P2+P3)*s**3)
+		H1 = self.handles[seg,0]
+		H2 = self.handles[seg,1]
+		bezier = (1-s)**3*P1+3*(1-s)**2*s*H1+3*(1-s)*s**2*H2+s**3*P2
+		pos = np.where(kind == 0,linear,np.where(kind == 1,catmullrom,bezier))
+		pos = self._convert(pos)
+		return(pos[0] if scalar else pos)
+
+	def _convert(self,pos):
+		if self.coords == self.output:
+			return(pos)
+		if self.coords == 'sph':
+			# (r,azi,ele) -> (x,y,z)
+			return(s2c(pos))
+		# (x,y,z) -> (r,azi,ele) in the degrees convention of s2c
+		sph = c2s(pos)
+		return(np.stack((sph[:,0],np.degrees(sph[:,1]),90-np.degrees(sph[:,2])),axis=-1))
+
+	def __call__(self,u):
+		# position at the fraction u (0..1) of the duration, as envelopes.trajectory samples it
+		return(self.at(self.times[0]+u*self.duration()))
+
+	def sample(self,rate):
+		# positions at the control rate over the whole duration (for plots or offline rendering)
+		return(self.at(self.times[0]+np.arange(int(self.duration()/rate)+1)*rate))
@@ -0,0 +1,93 @@
+#
+# msctools: my collection of composing and performing tools in python
+#
+# © 2023 Marco Buongiorno Nardelli
+#
+
+# local mirror of Live state kept up to date by the AbletonOSC listeners
+#
+# once a property is watched, every value pushed by Live (to osctools.server or an
+# asynctools transport) updates the mirror, and the getters in base.py answer from it
+# without a round-trip, e.g.
+#	watchSong()
+#	watchTracks(tracks,['volume'])
+#	watchDevice(devices[0][1])
+#	Song().tempo(mode='get')	# from the mirror
+# the mirror follows a single Live instance (the one replying to the server)
+
+import threading
+
+from .osctools import client, queryAll, watchers
+import msctools.cfg as cfg
+
+def _nids(address):
+	# number of leading arguments that identify the object (track, clip, device, parameter)
+	if address.startswith('/live/song/'):
+		return(0)
+	if address.startswith('/live/track/'):
+		return(1)
+	if address.startswith('/live/device/get/parameter/'):
+		return(3)
+	return(2)
+
+class mirror:
+
+	def __init__(self):
+		self.values = {}
+		self.watched = {}
+		self.lock = threading.Lock()
+
+	def update(self,address,args):
+		# only watched properties are stored: plain query replies could go stale
+		key = (address,tuple(args[:_nids(address)]))
+		if key in self.watched:
+			self.values[key] = tuple(args[_nids(address):])
+
+	def get(self,address,ids=()):
+		# current value (tuple of the reply arguments after the ids) or None if not mirrored
+		return(self.values.get((address,tuple(ids))))
+
+	def watch(self,props,host=cfg.HOST,port=cfg.PORT):
+		# props = list of (get address,ids), e.g. ("/live/track/get/volume",[0])
+		# start the listeners and seed the values with one pipelined query
+		with self.lock:
+			for address,ids in props:
+				self.watched[(address,tuple(ids))] = (host,port)
+				client(address.replace('/get/','/start_listen/'),list(ids),host,port).send()
+		seed = queryAll([(address,list(ids)) for address,ids in props],host,port)
+		for (address,ids),args in zip(props,seed):
+			if args is not None and (address,tuple(ids)) not in self.values:
+				self.update(address,args)
+
+	def unwatch(self,props=None):
+		# stop the listeners of props (all of them if None) and forget their values
+		with self.lock:
+			if props is None:
+				props = list(self.watched.keys())
+			for address,ids in props:
+				host,port = self.watched.pop((address,tuple(ids)),(None,None))
+				self.values.pop((address,tuple(ids)),None)
+				if host is not None:
+					client(address.replace('/get/','/stop_listen/'),list(ids),host,port).send()
+
+state = mirror()
+watchers.append(state.update)
+
+def watchSong(props=['tempo'],host=cfg.HOST,port=cfg.PORT):
+	state.watch([("/live/song/get/"+p,[]) for p in props],host,port)
+
+def watchTracks(tracks,props=['volume']):
+	if len(tracks) > 0:
+		state.watch([("/live/track/get/"+p,[tr.n]) for tr in tracks for p in props],tracks[0].host,tracks[0].port)
+
+def watchClips(clips):
+	# file paths of the clips, so that Clip.dur() sees a replaced sample
+	if len(clips) > 0:
+		state.watch([("/live/clip/get/file_path",[c.n,c.c]) for c in clips],clips[0].host,clips[0].port)
+
+def watchDevice(device,params=None):
+	# params = list of parameter indices (all the parameters of the device if None)
+	if params is None:
+		params = range(device.num())
+	state.watch([("/live/device/get/parameter/value",[device.n,device.d,p]) for p in params],
+				device.host,device.port)
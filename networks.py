@@ -8,45 +8,99 @@ import itertools
 import numpy as np
 import networkx as nx
 
-import re, sys, os, time
+import re, sys, os, time, threading, inspect, collections, heapq
 
-import music21 as m21
-
-	
 import json
-import pandas as pd
-from musicntwrk.harmony.scoreFilter import scoreFilter
-from musicntwrk.harmony.changePoint import changePoint
 
+# the music21/pandas/musicntwrk stack is imported on first use (see utils.lazy)
+from .utils import importSoundfiles, lazy
 
-from musicntwrk import musicntwrk
-from musicntwrk.musicntwrk import PCSet
-from musicntwrk.plotting.drawNetwork import drawNetwork
-mk = musicntwrk.musicntwrk(TET=12)
+m21 = lazy('music21')
+pd = lazy('pandas')
+scoreFilter = lazy('musicntwrk.harmony.scoreFilter','scoreFilter')
+changePoint = lazy('musicntwrk.harmony.changePoint','changePoint')
 
-from musicntwrk.harmony.harmonicDesign import harmonicDesign
-from musicntwrk.harmony.networkHarmonyGen import networkHarmonyGen
-from musicntwrk.harmony.rhythmicDesign import rhythmicDesign
-from musicntwrk.harmony.scoreDesign import scoreDesign
+musicntwrk = lazy('musicntwrk.musicntwrk')
+PCSet = lazy('musicntwrk.musicntwrk','PCSet')
+drawNetwork = lazy('musicntwrk.plotting.drawNetwork','drawNetwork')
+mk = lazy('musicntwrk.musicntwrk','musicntwrk',TET=12)
 
-from .utils import importSoundfiles
+harmonicDesign = lazy('musicntwrk.harmony.harmonicDesign','harmonicDesign')
+networkHarmonyGen = lazy('musicntwrk.harmony.networkHarmonyGen','networkHarmonyGen')
+rhythmicDesign = lazy('musicntwrk.harmony.rhythmicDesign','rhythmicDesign')
+scoreDesign = lazy('musicntwrk.harmony.scoreDesign','scoreDesign')
 
-def chinese_postman(graph,starting_node=None,verbose=False):
-	
-	def get_shortest_distance(graph, pairs, edge_weight_name):
-		return {pair : nx.dijkstra_path_length(graph, pair[0], pair[1], edge_weight_name) for pair in pairs}
+def chinese_postman(graph,starting_node=None,verbose=False,matching='exact'):
+	'''
+	eulerian circuit of graph after doubling the shortest paths between matched odd-degree nodes
+	one shortest-path pass per odd node (BFS if no edge has a "distance", Dijkstra otherwise),
+	whose predecessors are reused to build the augmenting paths
+	matching = "exact"  : minimum weight perfect matching of the odd nodes (networkx)
+	matching = "greedy" : closest pairs first - approximate, for graphs with thousands of odd nodes
+	'''
+	
+	def shortest_paths(graph, sources, edge_weight_name):
+		weighted = any(edge_weight_name in d for _,_,d in graph.edges(data=True))
+		paths = {}
+		for u in sources:
+			if weighted:
+				pred, dist = nx.dijkstra_predecessor_and_distance(graph, u, weight=edge_weight_name)
+			else:
+				pred, dist = nx.predecessor(graph, u, return_seen=True)
+			paths[u] = (pred, dist)
+		return paths
 	
-	def create_graph(node_pairs_with_weights, flip_weight = True):
+	def create_graph(odd_nodes, paths, flip_weight = True):
 		graph = nx.Graph()
-		for k,v in node_pairs_with_weights.items():
-			wt = -v if flip_weight else v
-			graph.add_edge(k[0], k[1], **{'distance': v, 'weight': wt})
+		for u,v in itertools.combinations(odd_nodes, 2):
+			if v in paths[u][1]:
+				d = paths[u][1][v]
+				graph.add_edge(u, v, **{'distance': d, 'weight': -d if flip_weight else d})
 		return graph
 	
-	def create_new_graph(graph, edges, starting_node=None):
+	def greedy_matching(odd_nodes, paths):
+		# closest pairs first: the heap holds one candidate per odd node, its nearest unmatched
+		# odd node, read lazily from the distances of its shortest-path pass (which Dijkstra
+		# and BFS list in increasing order), so no list of all the pairs is ever built
+		k = len(odd_nodes)
+		index = {u:i for i,u in enumerate(odd_nodes)}
+		nearest = [iter(paths[u][1].items()) for u in odd_nodes]
+		matched = np.zeros(k,dtype=bool)
+		heap = []
+		def offer(i):
+			for v,d in nearest[i]:
+				j = index.get(v)
+				if j is not None and j != i and not matched[j]:
+					heapq.heappush(heap,(d,i,j))
+					return
+		for i in range(k):
+			offer(i)
+		edges = set()
+		while heap and len(edges) < k//2:
+			_,i,j = heapq.heappop(heap)
+			if matched[i]:
+				continue
+			if matched[j]:
+				# stale candidate: next one of i
+				offer(i)
+				continue
+			matched[i] = matched[j] = True
+			edges.add((odd_nodes[i],odd_nodes[j]))
+		return edges
+	
+	def path(paths, u, v):
+		# walk back from v to u along the predecessors of the pass from u
+		pred = paths[u][0]
+		aug_path = [v]
+		while aug_path[-1] != u:
+			aug_path.append(pred[aug_path[-1]][0])
+		return aug_path[::-1]
+	
+	def create_new_graph(graph, edges, paths):
 		g = nx.MultiGraph()
 		for edge in edges:
-			aug_path  = nx.shortest_path(graph, edge[0], edge[1], weight="distance")
+			u, v = edge if edge[0] in paths else edge[::-1]
+			aug_path = path(paths, u, v)
 			aug_path_pairs  = list(zip(aug_path[:-1],aug_path[1:]))
 			
 			for aug_edge in aug_path_pairs:
@@ -59,18 +113,28 @@ def chinese_postman(graph,starting_node=None,verbose=False):
 	def create_eulerian_circuit(graph, starting_node=starting_node):
 		return list(nx.eulerian_circuit(graph,source=starting_node))
 	
+	t0 = time.perf_counter()
 	odd_degree_nodes = [node for node, degree in dict(nx.degree(graph)).items() if degree%2 == 1]
-	odd_degree_pairs = itertools.combinations(odd_degree_nodes, 2)
-	odd_nodes_pairs_shortest_path = get_shortest_distance(graph, odd_degree_pairs, "distance")
-	graph_complete_odd = create_graph(odd_nodes_pairs_shortest_path, flip_weight=True)
-	if verbose:
-		print('Number of nodes (odd): {}'.format(len(graph_complete_odd.nodes())))
-		print('Number of edges (odd): {}'.format(len(graph_complete_odd.edges())))
-	odd_matching_edges = nx.algorithms.max_weight_matching(graph_complete_odd, True)
+	paths = shortest_paths(graph, odd_degree_nodes, "distance")
+	t1 = time.perf_counter()
+	if matching == 'greedy':
+		odd_matching_edges = greedy_matching(odd_degree_nodes, paths)
+	else:
+		graph_complete_odd = create_graph(odd_degree_nodes, paths, flip_weight=True)
+		if verbose:
+			print('Number of nodes (odd): {}'.format(len(graph_complete_odd.nodes())))
+			print('Number of edges (odd): {}'.format(len(graph_complete_odd.edges())))
+		odd_matching_edges = nx.algorithms.max_weight_matching(graph_complete_odd, True)
+	if 2*len(odd_matching_edges) < len(odd_degree_nodes):
+		raise nx.NetworkXError('the odd-degree nodes cannot all be paired by paths: the graph is not connected')
 	if verbose: print('Number of edges in matching: {}'.format(len(odd_matching_edges)))
-	multi_graph = create_new_graph(graph, odd_matching_edges)
+	t2 = time.perf_counter()
+	multi_graph = create_new_graph(graph, odd_matching_edges, paths)
+	circuit = create_eulerian_circuit(multi_graph, starting_node)
+	if verbose:
+		print('shortest paths {:.3f} s, matching {:.3f} s, circuit {:.3f} s'.format(t1-t0,t2-t1,time.perf_counter()-t2))
 	
-	return(create_eulerian_circuit(multi_graph, starting_node))
+	return(circuit)
 
 def BachBAChorale(chorale,random=False,nseed=None):
 	
@@ -643,19 +707,132 @@ def fourPartScoreP(c,dirpaths,N,Nc,nseed=[None,None,None,None],ref=['e','e','e',
 	return([soprano,alto,tenor,bass])
 
 	
+# compiled sequences
+#
+# the eulerian sequence of a network model depends only on (nxmodel, args, starting node)
+# when the generator is deterministic (no seed argument, or a fixed seed): it is computed
+# once and kept in an LRU cache, optionally persisted to a json file. Random models (seed
+# left to None) give a new sequence every time: the next one is precomputed in a background
+# thread while the current one plays
+
+def _eulerian(nxmodel,args,starting_node=None):
+	Gx = getattr(nx,nxmodel)(*args)
+	chino = chinese_postman(Gx,starting_node,verbose=False)
+	seq = [chino[0][0]]
+	for s in range(1,len(chino)):
+		seq.append(chino[s][1])
+	return(seq)
+
+def _random(nxmodel,args):
+	# True if the generator draws a new graph at every call
+	try:
+		bound = inspect.signature(getattr(nx,nxmodel)).bind(*args)
+	except (TypeError,ValueError):
+		return(False)
+	bound.apply_defaults()
+	return('seed' in bound.arguments and bound.arguments['seed'] is None)
+
+def _tuples(node):
+	if isinstance(node,list):
+		return(tuple(_tuples(n) for n in node))
+	return(node)
+
+class sequences:
+	
+	def __init__(self,size=64,path=None):
+		self.size = size
+		self.path = path
+		self.cache = collections.OrderedDict()
+		self.ahead = {}
+		self.lock = threading.Lock()
+		self.hits = 0
+		self.misses = 0
+		if path is not None:
+			self.load(path)
+			
+	def get(self,nxmodel='barabasi_albert_graph',args=(),starting_node=None):
+		args = tuple(args)
+		if _random(nxmodel,args):
+			return(self._next(nxmodel,args,starting_node))
+		try:
+			key = json.dumps([nxmodel,list(args),starting_node])
+		except TypeError:
+			# arguments that cannot be a key (e.g. a graph): no caching
+			return(_eulerian(nxmodel,args,starting_node))
+		with self.lock:
+			if key in self.cache:
+				self.cache.move_to_end(key)
+				self.hits += 1
+				return(list(self.cache[key]))
+			self.misses += 1
+		seq = _eulerian(nxmodel,args,starting_node)
+		with self.lock:
+			self.cache[key] = seq
+			while len(self.cache) > self.size:
+				self.cache.popitem(last=False)
+		if self.path is not None:
+			self.save()
+		return(list(seq))
+	
+	def _next(self,nxmodel,args,starting_node):
+		# sequence precomputed in the background (computed now the first time),
+		# and start the precompute of the following one
+		key = (nxmodel,args,starting_node)
+		with self.lock:
+			job = self.ahead.pop(key,None)
+			if job is None:
+				self.misses += 1
+			else:
+				self.hits += 1
+		if job is None:
+			seq = _eulerian(nxmodel,args,starting_node)
+		else:
+			job[0].join()
+			seq = job[1]
+		job = [None,None]
+		def work():
+			job[1] = _eulerian(nxmodel,args,starting_node)
+		job[0] = threading.Thread(target=work,daemon=True)
+		with self.lock:
+			self.ahead[key] = job
+		job[0].start()
+		return(seq)
+	
+	def clear(self):
+		with self.lock:
+			self.cache.clear()
+			self.ahead.clear()
+	
+	def save(self,path=None):
+		with self.lock:
+			with open(path or self.path,'w') as f:
+				json.dump(dict(self.cache),f,separators=(',',':'))
+				
+	def load(self,path=None):
+		try:
+			with open(path or self.path) as f:
+				stored = json.load(f)
+		except (OSError,ValueError):
+			return
+		with self.lock:
+			# json turned the tuple nodes (e.g. of grid_2d_graph) into lists: nodes are
+			# hashable, so every list in a sequence was a tuple
+			self.cache.update({key:[_tuples(node) for node in seq] for key,seq in stored.items()})
+			while len(self.cache) > self.size:
+				self.cache.popitem(last=False)
+				
+	def stats(self):
+		return({'cached':len(self.cache),'hits':self.hits,'misses':self.misses})
+
+compiled = sequences()
+
 def sequence(nxmodel='barabasi_albert_graph',*args):
     ''' 
     : sequence defined by the eulerian path on a network
     : network models can be found here: 
     : https://networkx.org/documentation/stable/reference/generators.html
                         : arguments are passed through *args
+    : deterministic models are computed once (see compiled), random ones are precomputed
     '''
 
-    mynetx = getattr(nx,nxmodel)
-    Gx = mynetx(*args)
-    chino = chinese_postman(Gx,None,verbose=False)
-    seq = [chino[0][0]]
-    for s in range(1,len(chino)):
-        seq.append(chino[s][1])
-
-    return(seq)
\ No newline at end of file
+    return(compiled.get(nxmodel,args))
\ No newline at end of file
@@ -4,12 +4,60 @@
 # © 2023 Marco Buongiorno Nardelli
 #
 
+import threading, time
+
 from pythonosc.udp_client import SimpleUDPClient
+from pythonosc.osc_message_builder import OscMessageBuilder
+from pythonosc.osc_bundle_builder import OscBundleBuilder, IMMEDIATELY
 from pythonosc.dispatcher import Dispatcher
 from pythonosc.osc_server import ThreadingOSCUDPServer
 
 import msctools.cfg as cfg
 
+class connection:
+	# long-lived UDP client shared by all messages going to the same (host, port)
+	# no lock on the sending path: each message is built in the calling thread and goes out
+	# in a single sendto, which the OS keeps atomic, so the pooled send costs the same as a
+	# reused SimpleUDPClient whether one thread or several send at once
+	def __init__(self,host,port):
+		self.host = host
+		self.port = port
+		self.udp = SimpleUDPClient(host,port)
+		
+	def send(self,address,values):
+		return self.udp.send_message(address,values)
+		
+	def send_packet(self,content):
+		# send an already built OscMessage or OscBundle
+		return self.udp.send(content)
+		
+	def close(self):
+		# close_pool() drops the connection first: later sends open a new one
+		self.udp._sock.close()
+
+_pool = {}
+_pool_lock = threading.Lock()
+
+def pool(host=cfg.HOST,port=cfg.PORT):
+	# return the pooled connection for (host, port), creating it on first use
+	try:
+		return _pool[(host,port)]
+	except KeyError:
+		with _pool_lock:
+			if (host,port) not in _pool:
+				_pool[(host,port)] = connection(host,port)
+			return _pool[(host,port)]
+	
+def close_pool():
+	# close all pooled sockets (e.g. at the end of a performance)
+	with _pool_lock:
+		for conn in _pool.values():
+			conn.close()
+		_pool.clear()
+
+# callables (address,values,host,port) that see every message as it is sent (e.g. recorder.py)
+taps = []
+
 class client:
 	def __init__(self,address,values,host="127.0.0.1",port=11000):
 		self.host = host
@@ -18,13 +66,422 @@ class client:
 		self.values = values
 		
 	def send(self):
-		return SimpleUDPClient(self.host,self.port).send_message(self.address,self.values)
+		values = self.values
+		if cfg.DELTA and changes.filters(self.address):
+			values = changes.filter(self.address,values,self.host,self.port)
+			if values is None:
+				return
+		if cfg.COALESCE and coalescable(self.address):
+			return latest.put(self.address,values,self.host,self.port)
+		if taps:
+			for tap in taps:
+				tap(self.address,values,self.host,self.port)
+		return pool(self.host,self.port).send(self.address,values)
+	
+def message(address,values):
+	# build an OscMessage the same way SimpleUDPClient.send_message does
+	builder = OscMessageBuilder(address=address)
+	if values is None:
+		pass
+	elif isinstance(values,(list,tuple)):
+		for val in values:
+			builder.add_arg(val)
+	else:
+		builder.add_arg(values)
+	return builder.build()
+
+class bundle:
+	# collects all the messages produced in one tick and sends them as a single OSC bundle
+	# delay = None sends the bundle for immediate execution, otherwise the timetag is set
+	# delay seconds in the future (only receivers that honor timetags will wait)
+	# with cfg.COALESCE = True the set messages of an immediate bundle go to the coalescer
+	# (coalesce = False sends them as they are, as the coalescer itself does)
+	# delta = True/False turns the delta filter on/off for this bundle (cfg.DELTA if None)
+	# usage:
+	#	with bundle(host,port) as b:
+	#		b.add("/live/track/set/volume",[0,0.85])
+	#		b.add("/live/track/set/volume",[1,0.85])
+	MAXSIZE = 8192
+	
+	def __init__(self,host=cfg.HOST,port=cfg.PORT,delay=None,coalesce=True,delta=None):
+		self.host = host
+		self.port = port
+		self.delay = delay
+		self.coalesce = coalesce
+		self.delta = delta
+		self.messages = []
+		
+	def add(self,address,values):
+		if (cfg.DELTA if self.delta is None else self.delta) and changes.filters(address):
+			values = changes.filter(address,values,self.host,self.port)
+			if values is None:
+				return(self)
+		if cfg.COALESCE and self.coalesce and self.delay is None and coalescable(address):
+			latest.put(address,values,self.host,self.port)
+			return(self)
+		if taps:
+			for tap in taps:
+				tap(address,values,self.host,self.port)
+		self.messages.append(message(address,values))
+		return(self)
+	
+	def __len__(self):
+		return(len(self.messages))
+	
+	def send(self,delay=None):
+		if delay is None:
+			delay = self.delay
+		if len(self.messages) == 0:
+			return
+		if delay is None:
+			timetag = IMMEDIATELY
+		else:
+			timetag = time.time()+delay
+		conn = pool(self.host,self.port)
+		# split into several bundles if the datagram would get too large
+		builder = OscBundleBuilder(timetag)
+		size = 16
+		for msg in self.messages:
+			if size+msg.size+4 > self.MAXSIZE and size > 16:
+				conn.send_packet(builder.build())
+				builder = OscBundleBuilder(timetag)
+				size = 16
+			builder.add_content(msg)
+			size += msg.size+4
+		conn.send_packet(builder.build())
+		self.messages = []
+		
+	def __enter__(self):
+		return(self)
+	
+	def __exit__(self,exc_type,exc_value,traceback):
+		if exc_type is None:
+			self.send()
+			
+def bundleSend(messages,delay=None,delta=None):
+	# messages = list of (address,values,host,port)
+	# sends one bundle per destination, preserving the order of the messages
+	bundles = {}
+	for address,values,host,port in messages:
+		if (host,port) not in bundles:
+			bundles[(host,port)] = bundle(host,port,delay,delta=delta)
+		bundles[(host,port)].add(address,values)
+	for b in bundles.values():
+		b.send()
+	
+# latest-value-wins sending
+#
+# with cfg.COALESCE = True the set messages of client(), bundle() and bundleSend() are not sent
+# right away: they are queued per (destination, address, target) and a background thread
+# flushes the queue every cfg.FLUSH seconds as bundles, so a value superseded before the
+# flush (e.g. by another envelope or trajectory thread) is never sent
+
+# number of leading arguments that identify the target of a set message
+# (any other /set/ address: all arguments but the last one)
+targets = {
+	'/live/track/set/volume': 1,
+	'/live/track/set/panning': 1,
+	'/live/device/set/parameter/value': 3,
+	'/live/device/set/parameters/value': 2,
+	'/spat/serv': 2,
+}
+
+def coalescable(address):
+	return(address in targets or '/set/' in address)
+
+class coalescer:
+	
+	def __init__(self,interval=None):
+		self.interval = interval
+		self.pending = {}
+		self.lock = threading.Lock()
+		self.thread = None
+		self.running = False
+		self.sent = 0
+		self.dropped = 0
+		
+	def put(self,address,values,host=cfg.HOST,port=cfg.PORT):
+		values = list(values) if isinstance(values,(list,tuple)) else [values]
+		ntarget = targets.get(address,len(values)-1)
+		key = (host,port,address,tuple(values[:ntarget]))
+		with self.lock:
+			if key in self.pending:
+				self.dropped += 1
+				# keep the position in the queue, replace the value
+			self.pending[key] = (address,values,host,port)
+		if not self.running:
+			self.start()
+			
+	def flush(self):
+		with self.lock:
+			pending = self.pending
+			self.pending = {}
+		if len(pending) > 0:
+			bundles = {}
+			for address,values,host,port in pending.values():
+				if (host,port) not in bundles:
+					# already through the delta filter on their way in
+					bundles[(host,port)] = bundle(host,port,coalesce=False,delta=False)
+				bundles[(host,port)].add(address,values)
+			for b in bundles.values():
+				b.send()
+			self.sent += len(pending)
+			
+	def _run(self):
+		deadline = time.monotonic()
+		while self.running:
+			deadline += self.interval if self.interval is not None else cfg.FLUSH
+			wait = deadline-time.monotonic()
+			if wait > 0:
+				time.sleep(wait)
+			else:
+				deadline = time.monotonic()
+			self.flush()
+		self.flush()
+			
+	def start(self):
+		with self.lock:
+			if self.running:
+				return
+			self.running = True
+			self.thread = threading.Thread(target=self._run,daemon=True)
+			self.thread.start()
+			
+	def stop(self):
+		# stop the background thread after a last flush
+		self.running = False
+		if self.thread is not None:
+			self.thread.join()
+			self.thread = None
+			
+	def stats(self):
+		return({'sent':self.sent,'dropped':self.dropped,'pending':len(self.pending)})
+
+latest = coalescer()
+
+# delta suppression
+#
+# with cfg.DELTA = True a set message of a continuous parameter stream (the addresses in
+# continuous, or configured) with float values is not sent when its value differs from the
+# last value sent to the same target by no more than epsilon (cfg.EPSILON unless configured
+# for the address or the target), i.e. by less than the receiving parameter can resolve.
+# Toggles, names and integer values (arm, solo, looping...) always go out, as they can be
+# changed from Live. Values can also be quantized to the step of the device before the
+# comparison. The filter sits where the messages enter (client.send and bundle.add, before
+# coalescing), and the envelope engine and the Spat driver skip their unchanged values
+# through it whatever cfg.DELTA, e.g.
+#	changes.configure("/live/device/set/parameter/value",step=1/127,target=[1,0,1])
+# a value changed from elsewhere (e.g. a fader moved in Live) is not known to the filter:
+# changes.reset() makes all of them send everything again
+
+continuous = {
+	'/live/track/set/volume',
+	'/live/track/set/panning',
+	'/live/track/set/send',
+	'/live/device/set/parameter/value',
+	'/spat/serv',
+}
+
+class deltafilter:
+	
+	def __init__(self):
+		self.addresses = set(continuous)
+		self.epsilon = {}
+		self.step = {}
+		self.last = {}
+		self.counts = {}
+		self.lock = threading.Lock()
+		self.sent = 0
+		self.suppressed = 0
+		
+	def configure(self,address,epsilon=None,step=None,target=None):
+		# threshold and quantization step of an address, or of one target of it
+		# (an address not in continuous is filtered from then on)
+		self.addresses.add(address)
+		key = address if target is None else (address,tuple(target))
+		if epsilon is not None:
+			self.epsilon[key] = epsilon
+		if step is not None:
+			self.step[key] = step
+			
+	def filters(self,address):
+		return(address in self.addresses)
+			
+	def filter(self,address,values,host=cfg.HOST,port=cfg.PORT):
+		# values to send (quantized), or None if the change is below the threshold
+		values = list(values) if isinstance(values,(list,tuple)) else [values]
+		ntarget = targets.get(address,len(values)-1)
+		target = tuple(values[:ntarget])
+		value = values[ntarget:]
+		if len(value) == 0 or not all(isinstance(v,float) for v in value):
+			# not a float stream: sent as it is
+			return(values)
+		step = self.step.get((address,target),self.step.get(address))
+		if step is not None:
+			value = [round(v/step)*step for v in value]
+		eps = self.epsilon.get((address,target),self.epsilon.get(address,cfg.EPSILON))
+		key = (host,port,address,target)
+		with self.lock:
+			count = self.counts.setdefault(address,[0,0])
+			last = self.last.get(key)
+			if last is not None and len(last) == len(value) and \
+				all(abs(v-l) <= eps for v,l in zip(value,last)):
+				count[1] += 1
+				self.suppressed += 1
+				return(None)
+			self.last[key] = value
+			count[0] += 1
+			self.sent += 1
+		return(list(target)+value)
+	
+	def note(self,address,values,host=cfg.HOST,port=cfg.PORT):
+		# record values as sent (e.g. set explicitly, bypassing the filter)
+		values = list(values) if isinstance(values,(list,tuple)) else [values]
+		ntarget = targets.get(address,len(values)-1)
+		if all(isinstance(v,float) for v in values[ntarget:]):
+			with self.lock:
+				self.last[(host,port,address,tuple(values[:ntarget]))] = values[ntarget:]
+				
+	def reset(self):
+		with self.lock:
+			self.last.clear()
+			
+	def stats(self,verbose=False):
+		# sent vs suppressed messages, in total and by address
+		if verbose:
+			for address,(sent,suppressed) in sorted(self.counts.items()):
+				print('{:40s} {:8d} sent {:8d} suppressed'.format(address,sent,suppressed))
+		return({'sent':self.sent,'suppressed':self.suppressed,
+				'addresses':{address:tuple(count) for address,count in self.counts.items()}})
+
+changes = deltafilter()
+
+class request:
+	# an outstanding query: resolved by the reply router when the matching reply arrives
+	def __init__(self,address,prefix):
+		self.address = address
+		self.prefix = tuple(prefix)
+		self.event = threading.Event()
+		self.args = None
+		
+	def matches(self,address,args):
+		return(address == self.address and tuple(args[:len(self.prefix)]) == self.prefix)
+	
+	def resolve(self,args):
+		self.args = args
+		self.event.set()
+		
+	def wait(self,timeout=None):
+		if self.event.wait(timeout):
+			return(self.args)
+		return(None)
+	
+class router:
+	# matches incoming replies to outstanding requests by address and argument prefix
+	# requests with the same address and prefix are resolved in the order they were made
+	def __init__(self):
+		self.pending = {}
+		self.lock = threading.Lock()
+		
+	def expect(self,address,prefix,factory=request):
+		req = factory(address,prefix)
+		with self.lock:
+			self.pending.setdefault(address,[]).append(req)
+		return(req)
+	
+	def cancel(self,req):
+		with self.lock:
+			try:
+				self.pending[req.address].remove(req)
+			except (KeyError,ValueError):
+				pass
+			
+	def dispatch(self,address,args):
+		# returns True if the reply answered an outstanding request
+		with self.lock:
+			waiting = self.pending.get(address)
+			if not waiting:
+				return(False)
+			for req in waiting:
+				if req.matches(address,args):
+					waiting.remove(req)
+					break
+			else:
+				return(False)
+		req.resolve(args)
+		return(True)
+	
+replies = router()
+
+# callables (address,args) that see every reply and pushed value received by the server
+watchers = []
+
+def query(address,values,host=cfg.HOST,port=cfg.PORT,timeout=None,prefix=None):
+	# send a query and return the arguments of its reply as soon as it arrives
+	# the reply is matched by address and by the query arguments (track, clip, device...)
+	# which are echoed at the beginning of every AbletonOSC reply
+	# (prefix = the arguments to match instead, e.g. [] for replies that do not echo them)
+	if timeout is None:
+		timeout = cfg.TIMEOUT
+	req = replies.expect(address,values if prefix is None else prefix)
+	client(address,values,host,port).send()
+	args = req.wait(timeout)
+	if args is None:
+		replies.cancel(req)
+		raise TimeoutError('no reply to {} {} from {}:{}'.format(address,values,host,port))
+	return(args)
+	
+class _batched(request):
+	# request of a pipelined batch: wakes up the batch when its reply arrives
+	def __init__(self,address,prefix,batch):
+		super().__init__(address,prefix)
+		self.batch = batch
+		self.sent = None
+		
+	def resolve(self,args):
+		with self.batch:
+			super().resolve(args)
+			self.batch.notify()
+
+def queryAll(queries,host=cfg.HOST,port=cfg.PORT,timeout=None,window=64):
+	# pipelined version of query: queries = list of (address,values)
+	# requests are fired back-to-back, keeping at most window of them waiting for a reply,
+	# and the replies are collected as they arrive - returns the reply arguments in the same
+	# order as the queries, None where no reply came back within timeout seconds
+	if timeout is None:
+		timeout = cfg.TIMEOUT
+	batch = threading.Condition()
+	reqs = [replies.expect(address,values,lambda a,p: _batched(a,p,batch)) for address,values in queries]
+	conn = pool(host,port)
+	inflight = []
+	nsent = 0
+	with batch:
+		while True:
+			now = time.monotonic()
+			inflight = [req for req in inflight if not req.event.is_set() and now-req.sent < timeout]
+			while nsent < len(reqs) and len(inflight) < window:
+				reqs[nsent].sent = time.monotonic()
+				conn.send(*queries[nsent])
+				inflight.append(reqs[nsent])
+				nsent += 1
+			if len(inflight) == 0:
+				break
+			batch.wait(max(0.0,inflight[0].sent+timeout-time.monotonic()))
+	results = []
+	for req in reqs:
+		if req.args is None:
+			replies.cancel(req)
+		results.append(req.args)
+	return(results)
 	
 def server(ip,port):
 	def handler(address, *args):
+		for watcher in watchers:
+			watcher(address,args)
 		if address != '/live/song/beat': 
 			cfg.data = args
 			cfg.addr = address
+			replies.dispatch(address,args)
 			if cfg.write:
 				print(f"{address}: {args}")
 		if address == '/live/song/beat':
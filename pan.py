@@ -4,14 +4,19 @@
 # © 2023 Marco Buongiorno Nardelli
 #
 
+from .osctools import bundleSend
+
+def _setPanning(tracks,pan):
+	# all tracks are panned at once with a single bundle
+	bundleSend([("/live/track/set/panning",[tr.n,pan[n]],tr.host,tr.port) 
+		for n,tr in enumerate(tracks)])
+
 def panning(tracks,mode=0):
 	if mode == 0:
 		# reset panning to center
 		pan = [0]*len(tracks)
-		for n in range(len(tracks)):
-			tracks[n].panning(pan=pan[n],mode='set')
+		_setPanning(tracks,pan)
 	if mode == 1:
 		# distribute panning at equal angles
 		pan = [-1+2/(len(tracks)-1)*p for p in range(len(tracks))]
-		for n in range(len(tracks)):
-			tracks[n].panning(pan=pan[n],mode='set')
\ No newline at end of file
+		_setPanning(tracks,pan)
\ No newline at end of file
@@ -6,16 +6,18 @@
 
 import time
 import numpy as np
-import networkx as nx
-import pyo
 
 from .networks import *
 from .devices import Spat
 from .osctools import client
+from .decorators import task
+from .scheduler import sender
 
 import msctools.cfg as cfg
 
-def playerA(clips,clipsdur,track,delay=0.0,source=None,random=False,Y0=1.0,Z0=0.0,azi=0.0,ele=0.0,mode='network',external=None,nxmodel='barabasi_albert_graph',*args):
+@task
+def playerA(clips,clipsdur,track,delay=0.0,source=None,random=False,Y0=1.0,Z0=0.0,azi=0.0,ele=0.0,mode='network',external=None,nxmodel='barabasi_albert_graph',*args,
+			lookahead=None):
 	''' 
 	Play clips in sequence waiting for next clip in following mode
 	mode = "network"    : sequence defined by the eulerian path on a network
@@ -25,21 +27,19 @@ def playerA(clips,clipsdur,track,delay=0.0,source=None,random=False,Y0=1.0,Z0=0.
 	mode = "sequential" : plays the clips in descending order
 	mode = "random"     : plays clips in random order
 	mode = "external"   : plays clip with a user supplied sequence
+	lookahead           : the fires go out lookahead seconds early in timetagged bundles
+						: if (cfg.HOST,cfg.PORT) is in cfg.TIMETAGS, just in time otherwise
+	blocking when called: use playerA.spawn(...) to run it on the shared event loop
 	'''
-	# delay the start of playback
-	time.sleep(delay)
+	# onsets on absolute deadlines, the first one after delay
+	out = sender(cfg.HOST,cfg.PORT,lookahead,track)
+	onset = time.monotonic()+delay
 	while True:
 		if cfg.stop[track]:
 			break
 		if mode == 'network':
-			mynetx = getattr(nx,nxmodel)
-			Gx = mynetx(*args)
-			chino = chinese_postman(Gx,None,verbose=False)
-			seq = [chino[0][0]]
-			for s in range(1,len(chino)):
-				seq.append(chino[s][1])
-				if cfg.stop[track]:
-					break
+			# cached, or precomputed while the previous sequence played (random models)
+			seq = compiled.get(nxmodel,args)
 		elif mode == 'sequential':
 			seq = np.linspace(0,len(clips[track])-1,len(clips[track]),dtype=int).tolist()
 		elif mode == 'random':
@@ -50,16 +50,19 @@ def playerA(clips,clipsdur,track,delay=0.0,source=None,random=False,Y0=1.0,Z0=0.
 		else:
 			print('mode not implemented')
 		for n in range(len(seq)):
+			yield out.wait(onset)
+			if cfg.stop[track]:
+				break
 			# set position of Spat source if needed
 			if random:
 				X = 2.0*np.random.rand() - 1.0
 				Spat(source).car(X,Y0,Z0,azi,ele)
-			client("/live/clip/fire",[track,seq[n]],cfg.HOST,cfg.PORT).send()
-			time.sleep(np.abs(clipsdur[track][seq[n]]+np.random.rand()*cfg.sleep[track]))
-			if cfg.stop[track]:
-				break
+			out.send("/live/clip/fire",[track,seq[n]])
+			onset += np.abs(clipsdur[track][seq[n]]+np.random.rand()*cfg.sleep[track])
 
-def playerB(clips,track,delay=0.0,source=False,azi=0.0,ele=0.0,mode='network',external=None,nxmodel='barabasi_albert_graph',*args):
+@task
+def playerB(clips,track,delay=0.0,source=False,azi=0.0,ele=0.0,mode='network',external=None,nxmodel='barabasi_albert_graph',*args,
+			sync=None,lookahead=None):
 	''' 
 	Play clips in sequence at set time intervals quantizaed according to tempo in bpm: 1/n.
 	mode = "network"    : sequence defined by the eulerian path on a network
@@ -69,21 +72,25 @@ def playerB(clips,track,delay=0.0,source=False,azi=0.0,ele=0.0,mode='network',ex
 	mode = "sequential" : plays the clips in descending order
 	mode = "random"     : plays clips in random order
 	mode = "external"   : plays clip with a user supplied sequence
+	sync = beatclock    : fires on the grid of cfg.beat[track] beats of Live's transport,
+						: lookahead seconds (default cfg.LOOKAHEAD) before each boundary
+	lookahead           : the fires go out lookahead seconds early in timetagged bundles
+						: if (cfg.HOST,cfg.PORT) is in cfg.TIMETAGS, just in time otherwise
+	blocking when called: use playerB.spawn(...) to run it on the shared event loop
 	'''
-	# delay the start of playback
-	time.sleep(delay)
+	# onsets on absolute deadlines, the first one after delay (on the grid if synced)
+	out = sender(cfg.HOST,cfg.PORT,lookahead,track,compensate=sync is not None)
+	if sync is not None:
+		bpos = sync.grid(cfg.beat[track],time.monotonic()+delay+out.lookahead)
+		onset = sync.timeof(bpos)
+	else:
+		onset = time.monotonic()+delay
 	while True:
 		if cfg.stop[track]:
 			break
 		if mode == 'network':
-			mynetx = getattr(nx,nxmodel)
-			Gx = mynetx(*args)
-			chino = chinese_postman(Gx,None,verbose=False)
-			seq = [chino[0][0]]
-			for s in range(1,len(chino)):
-				seq.append(chino[s][1])
-				if cfg.stop[track]:
-					break
+			# cached, or precomputed while the previous sequence played (random models)
+			seq = compiled.get(nxmodel,args)
 		elif mode == 'sequential':
 			seq = np.linspace(0,len(clips[track])-1,len(clips[track]),dtype=int).tolist()
 		elif mode == 'random':
@@ -94,41 +101,65 @@ def playerB(clips,track,delay=0.0,source=False,azi=0.0,ele=0.0,mode='network',ex
 		else:
 			print('mode not implemented')
 		for n in range(len(seq)):
+			yield out.wait(onset)
+			if cfg.stop[track]:
+				break
 			# set position of Spat source if needed
 			if source:
 				X = 2.0*np.random.rand() - 1.0
 				Spat(track+1).car(X,1.0,0.0,azi,ele)
-			client("/live/clip/fire",[track,seq[n]],cfg.HOST,cfg.PORT).send()
+			out.send("/live/clip/fire",[track,seq[n]])
 			tsleep = np.max([np.abs(60.0/cfg.tempo*cfg.beat[track]+np.random.rand()*cfg.sleep[track]),
 							 np.abs(clips[track][seq[n]].dur()+np.random.rand()*cfg.sleep[track])])
-			time.sleep(tsleep)
-			if cfg.stop[track]:
-				break
+			if sync is not None:
+				# next boundary of the grid at least tsleep after this one
+				bpos += np.ceil(tsleep/sync.period/cfg.beat[track]-1e-6)*cfg.beat[track]
+				onset = sync.timeof(bpos)
+			else:
+				onset += tsleep
 			
-def scorePlayer(clips,track,score,delay=0,hold=False):
+@task
+def scorePlayer(clips,track,score,delay=0,hold=False,sync=None,lookahead=None):
 	''' 
 	Play clips in sequence according to a score read as musicxml (pitch + duration)
 	score[0] = pitches
 	score[1] = durations in units of quantization (usually 1/4 if not specified otherwise)
+	sync = beatclock : durations are counted on the beats of Live's transport (no random jitter),
+					 : fires are sent lookahead seconds (default cfg.LOOKAHEAD) before each beat position
+	lookahead        : the fires go out lookahead seconds early in timetagged bundles
+					 : if (cfg.HOST,cfg.PORT) is in cfg.TIMETAGS, just in time otherwise
+	blocking when called: use scorePlayer.spawn(...) to run it on the shared event loop
 	'''
 	# delay the start of playback - if for any reason is desired
-	time.sleep(delay)
+	out = sender(cfg.HOST,cfg.PORT,lookahead,track,compensate=sync is not None)
+	if sync is not None:
+		bpos = sync.grid(cfg.beat[track],time.monotonic()+delay+out.lookahead)
+		onset = sync.timeof(bpos)
+	else:
+		onset = time.monotonic()+delay
 	while True:
 		if cfg.stop[track]:
 			break
 		seq = score[0]
 		dur = score[1]
 		for n in range(len(seq)):
-			client("/live/clip/fire",[track,seq[n]],port=11000).send()
+			yield out.wait(onset)
+			if cfg.stop[track]:
+				break
+			out.send("/live/clip/fire",[track,seq[n]])
 			if hold:
 				tsleep = np.max([np.abs(60.0/cfg.tempo*cfg.beat[track]*dur[n]+(2*np.random.rand()-1)*cfg.sleep[track]),
 								np.abs(clips[track][seq[n]].dur()+np.random.rand()*cfg.sleep[track])])
-				time.sleep(tsleep)
 			else:
 				tsleep = np.abs(60.0/cfg.tempo*cfg.beat[track]*dur[n]+(2*np.random.rand()-1)*cfg.sleep[track])
-				time.sleep(tsleep)
-			if cfg.stop[track]:
-				break
+			if sync is not None:
+				step = cfg.beat[track]*dur[n]
+				if hold:
+					step = max(step,clips[track][seq[n]].dur()/sync.period)
+				bpos += step
+				onset = sync.timeof(bpos)
+			else:
+				onset += tsleep
 
 
 def playScene(scene,session,delay=0):
@@ -6,18 +6,22 @@
 
 import glob,time,ast
 import numpy as np
-import pyo
 
 import threading
 import numpy as np
 import networkx as nx
 
 from .networks import *
-from .decorators import threading_decorator
+from .utils import lazy
+from .decorators import threading_decorator, task
 
 import msctools.cfg as cfg
 
+# pyo is imported on first use
+pyo = lazy('pyo')
+
 @threading_decorator
+@task
 def playerP(clips=None,track=0,delay=0.0,offset=1.0,panning=None,gain=1.0,impulse=None,bal=0.25,
             mode='network',external=None,nxmodel='barabasi_albert_graph',*args):
     ''' 
@@ -31,10 +35,10 @@ def playerP(clips=None,track=0,delay=0.0,offset=1.0,panning=None,gain=1.0,impuls
     mode = "external"   : plays clip with a user supplied sequence
     '''
     def sleep(sec):
-        # internal scope function to pause execution while controlling the termination of the thread
+        # internal scope function to pause execution while controlling the termination of the task
         ntx = int(sec/cfg.TICK)
         for n in range(ntx):
-            time.sleep(cfg.TICK)
+            yield cfg.TICK
             if cfg.stop[track]:
                 if panout.isPlaying(): 
                     panout.setMul(pyo.SigTo(value=0.0, time=3.0, init=gain))
@@ -51,19 +55,13 @@ def playerP(clips=None,track=0,delay=0.0,offset=1.0,panning=None,gain=1.0,impuls
 
     if clips == None:
         return('no clips provided')
-    time.sleep(offset)
+    yield offset
     while True:
         if cfg.stop[track]:
             break
         if mode == 'network':
-            mynetx = getattr(nx,nxmodel)
-            Gx = mynetx(*args)
-            chino = chinese_postman(Gx,None,verbose=False)
-            seq = [chino[0][0]]
-            for s in range(1,len(chino)):
-                seq.append(chino[s][1])
-                if cfg.stop[track]:
-                    break
+            # cached, or precomputed while the previous sequence played (random models)
+            seq = compiled.get(nxmodel,args)
         elif mode == 'sequential':
             seq = np.linspace(0,len(clips)-1,len(clips),dtype=int).tolist()
         elif mode == 'random':
@@ -92,7 +90,7 @@ def playerP(clips=None,track=0,delay=0.0,offset=1.0,panning=None,gain=1.0,impuls
                 rev = snd
             panout = pyo.SPan(rev,outs=2,pan=pan,mul=gain).out()
             # time.sleep(pyo.sndinfo(clips[seq[n]])[1]+delay*np.random.rand())
-            sleep(pyo.sndinfo(clips[seq[n]])[1]+delay*np.random.rand())
+            yield from sleep(pyo.sndinfo(clips[seq[n]])[1]+delay*np.random.rand())
             panout.stop()
             rev.stop()
             snd.stop()
@@ -114,6 +112,7 @@ def playerP(clips=None,track=0,delay=0.0,offset=1.0,panning=None,gain=1.0,impuls
 
 
 @threading_decorator
+@task
 def scorePlayerP(clips,track,score,offset=0,panning=0.5,impulse=None,bal=0.25,gain=1.0,scaledur=1.0,fin=0.1,fout=0.2):
     ''' 
     Play clips in sequence according to a score (pitch + duration)
@@ -123,10 +122,10 @@ def scorePlayerP(clips,track,score,offset=0,panning=0.5,impulse=None,bal=0.25,ga
     # delay the start of playback - if for any reason is desired
 
     def sleep(sec):
-        # internal scope function to pause execution while controlling the termination of the thread
+        # internal scope function to pause execution while controlling the termination of the task
         ntx = int(sec/cfg.TICK)
         for n in range(ntx):
-            time.sleep(cfg.TICK)
+            yield cfg.TICK
             if cfg.stop[track]:
                 if panout.isPlaying():
                     panout.setMul(pyo.SigTo(value=0.0, time=3.0, init=gain))
@@ -141,7 +140,7 @@ def scorePlayerP(clips,track,score,offset=0,panning=0.5,impulse=None,bal=0.25,ga
                 break
         snd.stop()
 
-    time.sleep(offset)
+    yield offset
     while True:
         if cfg.stop[track]:
             break
@@ -162,7 +161,7 @@ def scorePlayerP(clips,track,score,offset=0,panning=0.5,impulse=None,bal=0.25,ga
             else:
                 rev = snd
             panout = pyo.SPan(rev,outs=2,pan=pan,mul=fade).out()
-            sleep(dur[n]*scaledur)
+            yield from sleep(dur[n]*scaledur)
             snd.stop()
             rev.stop()
             panout.stop()
@@ -175,16 +174,17 @@ def scorePlayerP(clips,track,score,offset=0,panning=0.5,impulse=None,bal=0.25,ga
 
 
 @threading_decorator
+@task
 def playerList(clips=None,track=0,delay=0.0,offset=1.0,panning=None,gain=1.0,impulse=None,bal=0.25,
             external=None,*args):
     ''' 
     Play clips in sequence waiting for next clip - Version for clips in two separate folders
     '''
     def sleep(sec):
-        # internal scope function to pause execution while controlling the termination of the thread
+        # internal scope function to pause execution while controlling the termination of the task
         ntx = int(sec/cfg.TICK)
         for n in range(ntx):
-            time.sleep(cfg.TICK)
+            yield cfg.TICK
             if cfg.stop[track]:
                 if panout.isPlaying(): 
                     panout.setMul(pyo.SigTo(value=0.0, time=3.0, init=gain))
@@ -199,7 +199,7 @@ def playerList(clips=None,track=0,delay=0.0,offset=1.0,panning=None,gain=1.0,imp
         return('no clips provided')
     else:
         assert(len(clips) == 2)
-    time.sleep(offset)
+    yield offset
     seq = external
     while True:
         if cfg.stop[track]:
@@ -236,7 +236,7 @@ def playerList(clips=None,track=0,delay=0.0,offset=1.0,panning=None,gain=1.0,imp
                     rev = snd
             
             panout = pyo.SPan(rev,outs=2,pan=pan,mul=gain).out()
-            sleep(cliptime+delay*np.random.rand())
+            yield from sleep(cliptime+delay*np.random.rand())
             panout.stop()
             rev.stop()
             snd.stop()
@@ -0,0 +1,160 @@
+#
+# msctools: my collection of composing and performing tools in python
+#
+# © 2023 Marco Buongiorno Nardelli
+#
+
+# recording and replay of the messages sent during a performance
+#
+# the recorder taps the sending path (osctools.taps) and appends one record per message,
+# (time, target, values), to a preallocated memory-mapped numpy file; the targets (address,
+# destination and leading arguments, e.g. ("/live/track/set/volume","127.0.0.1",11000,[0]))
+# are listed in a json file next to it. A recording is streamed back by replay() on the
+# scheduler, at real time or faster, e.g.
+#	rec = recorder('gesture.npy').start()
+#	...perform...
+#	rec.stop()
+#	replay.spawn('gesture.npy',speed=1.0)
+
+import os, json, time, threading, numbers
+import numpy as np
+
+from .osctools import bundle, targets, taps, coalescable
+from .scheduler import at
+from .decorators import task
+
+NVALUES = 5
+
+def _dtype(nvalues=NVALUES):
+	# ints = bit k set if value k was an integer (sent back as an int on replay)
+	return(np.dtype([('t','f8'),('target','i4'),('n','i2'),('ints','u4'),('values','f8',(nvalues,))]))
+
+def _number(v):
+	return(isinstance(v,(numbers.Real,np.number)) and not isinstance(v,(bool,np.bool_)))
+
+def _plain(v):
+	# numpy scalars as python values (for the json header)
+	return(v.item() if isinstance(v,np.generic) else v)
+
+def _header(filename):
+	return(os.path.splitext(filename)[0]+'.json')
+
+class recorder:
+	
+	def __init__(self,filename='performance.npy',capacity=1000000,nvalues=NVALUES):
+		self.filename = filename
+		self.capacity = capacity
+		self.nvalues = nvalues
+		self.records = None
+		self.n = 0
+		self.overflow = 0
+		self.targets = []
+		self.ids = {}
+		self.lock = threading.Lock()
+		self.t0 = None
+		
+	def start(self):
+		# preallocate the file and start recording
+		self.records = np.lib.format.open_memmap(self.filename,mode='w+',dtype=_dtype(self.nvalues),
+												shape=(self.capacity,))
+		self.n = 0
+		self.overflow = 0
+		self.targets = []
+		self.ids = {}
+		self.t0 = time.monotonic()
+		if self.record not in taps:
+			taps.append(self.record)
+		return(self)
+	
+	def record(self,address,values,host,port):
+		values = list(values) if isinstance(values,(list,tuple)) else [values]
+		ntarget = targets.get(address,len(values)-1) if coalescable(address) else len(values)
+		value = values[ntarget:]
+		if len(value) > self.nvalues or not all(_number(v) for v in value):
+			# events (e.g. clip fires) and non-numeric values: the whole message is the target
+			ntarget = len(values)
+			value = []
+		ints = 0
+		for k,v in enumerate(value):
+			if isinstance(v,(numbers.Integral,np.integer)):
+				ints |= 1<<k
+		value = [float(v) for v in value]
+		key = (address,host,port,tuple(_plain(v) for v in values[:ntarget]))
+		with self.lock:
+			if self.records is None:
+				# stopped while this message was on its way
+				return
+			# timestamp under the lock: records stay in time order across sending threads
+			t = time.monotonic()-self.t0
+			if self.n >= self.capacity:
+				self.overflow += 1
+				return
+			try:
+				target = self.ids[key]
+			except KeyError:
+				target = self.ids[key] = len(self.targets)
+				self.targets.append([address,host,port,list(key[3])])
+			rec = self.records[self.n]
+			rec['t'] = t
+			rec['target'] = target
+			rec['n'] = len(value)
+			rec['ints'] = ints
+			rec['values'][:len(value)] = value
+			self.n += 1
+			
+	def _flush(self):
+		# call with the lock held
+		self.records.flush()
+		with open(_header(self.filename),'w') as f:
+			json.dump({'n':self.n,'overflow':self.overflow,'targets':self.targets},f)
+			
+	def flush(self):
+		# make the records so far readable (the recording goes on)
+		with self.lock:
+			if self.records is not None:
+				self._flush()
+				
+	def stop(self):
+		with self.lock:
+			if self.record in taps:
+				taps.remove(self.record)
+			if self.records is not None:
+				self._flush()
+			self.records = None
+		if self.overflow > 0:
+			print('recording full: {} messages not recorded'.format(self.overflow))
+		
+def load(filename='performance.npy'):
+	# (records, targets) of a recording, records memory-mapped read only
+	with open(_header(filename)) as f:
+		header = json.load(f)
+	records = np.load(filename,mmap_mode='r')[:header['n']]
+	return(records,header['targets'])
+
+@task
+def replay(filename='performance.npy',speed=1.0,start=0.0,end=None,host=None,port=None,group=0.0005):
+	# send a recording again on its own timeline (speed = 2.0 plays it twice as fast), from
+	# start to end seconds of the recording, optionally to another destination; the messages
+	# recorded within group seconds of each other go out in the same bundle
+	records,tlist = load(filename)
+	t = records['t']
+	first = np.searchsorted(t,start)
+	last = len(records) if end is None else np.searchsorted(t,end,side='right')
+	t0 = time.monotonic()
+	i = first
+	while i < last:
+		j = i+1
+		while j < last and t[j]-t[i] <= group:
+			j += 1
+		yield at(t0+(t[i]-start)/speed)
+		bundles = {}
+		for rec in records[i:j]:
+			address,h,p,tgt = tlist[rec['target']]
+			dest = (host or h,port or p)
+			if dest not in bundles:
+				bundles[dest] = bundle(dest[0],dest[1])
+			values = [int(v) if rec['ints']>>k & 1 else v for k,v in enumerate(rec['values'][:rec['n']].tolist())]
+			bundles[dest].add(address,tgt+values)
+		for b in bundles.values():
+			b.send()
+		i = j
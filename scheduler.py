@@ -0,0 +1,381 @@
+#
+# msctools: my collection of composing and performing tools in python
+#
+# © 2023 Marco Buongiorno Nardelli
+#
+
+# timing of events
+
+import time, heapq, itertools, threading, collections
+import numpy as np
+
+from .osctools import client, bundle, watchers
+import msctools.cfg as cfg
+
+class at:
+	# absolute deadline (time.monotonic()) that a task can yield instead of a wait
+	def __init__(self,t):
+		self.t = t
+
+# timelines of the players by track, for the late-event statistics
+timelines = {}
+
+class timeline:
+	'''
+	Absolute deadlines on time.monotonic() for a sequence of events
+	each event waits for its own deadline, and the next deadline is computed from the previous
+	one (not from the time the event actually happened), so the time spent sending messages,
+	computing sequences or looking up durations never accumulates as drift
+	spin = seconds of busy wait (holding the GIL) before the deadline, cfg.SPIN if None: none by
+	default, the sleep jitter is absorbed by tolerance in the late-event statistics - set it
+	(e.g. cfg.SPIN = 0.001) when sub-millisecond onsets are worth one busy core per waiting task
+	usage:
+		clock = timeline(track)
+		for ev in events:
+			clock.wait()
+			...fire the event...
+			clock.advance(duration)
+	'''
+	def __init__(self,track=None,start=None,spin=None,tolerance=0.001):
+		self.track = track
+		self.start = time.monotonic() if start is None else start
+		self.deadline = self.start
+		self.spin = cfg.SPIN if spin is None else spin
+		self.tolerance = tolerance
+		self.events = 0
+		self.late = 0
+		self.lateness = 0.0
+		self.maxlate = 0.0
+		if track is not None:
+			timelines[track] = self
+
+	def wait(self):
+		# sleep until the deadline, the last spin seconds (if any) in a busy loop for accuracy
+		remaining = self.deadline-time.monotonic()
+		if remaining > self.spin:
+			time.sleep(remaining-self.spin)
+		if self.spin > 0:
+			while time.monotonic() < self.deadline:
+				pass
+		return(self.record(time.monotonic()-self.deadline))
+	
+	def record(self,late):
+		self.events += 1
+		self.lateness += late
+		self.maxlate = max(self.maxlate,late)
+		if late > self.tolerance:
+			self.late += 1
+		return(late)
+
+	def advance(self,dt):
+		if isinstance(dt,at):
+			self.deadline = dt.t
+		else:
+			self.deadline += dt
+		return(self.deadline)
+
+	def elapsed(self):
+		return(time.monotonic()-self.start)
+
+	def stats(self):
+		return({'events':self.events,'late':self.late,
+				'mean':self.lateness/self.events if self.events > 0 else 0.0,
+				'max':self.maxlate})
+
+def lateStats(verbose=True):
+	# late-event statistics of all the tracks
+	stats = {track:tl.stats() for track,tl in timelines.items()}
+	if verbose:
+		for track,st in sorted(stats.items()):
+			print('track {:3d}: {:6d} events {:5d} late  mean {:8.3f} ms  max {:8.3f} ms'.format(
+				track,st['events'],st['late'],1000*st['mean'],1000*st['max']))
+	return(stats)
+
+# tasks
+#
+# a task is a generator that yields the time (in seconds) to wait before its next step,
+# i.e. "yield dt" in place of "time.sleep(dt)". The same task can run blocking in its own
+# thread with run(), or with many others in the single thread of an eventloop, which keeps
+# all the tasks in a heap ordered by deadline and wakes up only when the next one is due
+
+def run(gen,track=None):
+	# drive a task in the calling thread on absolute deadlines
+	clock = timeline(track)
+	for dt in gen:
+		clock.advance(dt)
+		clock.wait()
+
+class eventloop:
+	
+	def __init__(self,spin=0.0002):
+		self.spin = spin
+		self.heap = []
+		self.cond = threading.Condition()
+		self.order = itertools.count()
+		self.cancelled = set()
+		self.thread = None
+		self.running = False
+		self.wakeups = 0
+		self.steps = 0
+		self.cpu = 0.0
+		self.t0 = None
+		
+	def spawn(self,gen,track=None,delay=0.0):
+		# add a task, first step after delay seconds
+		clock = timeline(track)
+		clock.advance(delay)
+		with self.cond:
+			heapq.heappush(self.heap,(clock.deadline,next(self.order),gen,clock))
+			self.cond.notify()
+		if not self.running:
+			self.start()
+		return(gen)
+	
+	def cancel(self,gen):
+		with self.cond:
+			self.cancelled.add(gen)
+			
+	def tasks(self):
+		return(len(self.heap))
+			
+	def _run(self):
+		cpu0 = time.thread_time()
+		while True:
+			with self.cond:
+				while self.running and (len(self.heap) == 0 or 
+										self.heap[0][0]-time.monotonic() > self.spin):
+					if len(self.heap) == 0:
+						self.cond.wait()
+					else:
+						self.cond.wait(self.heap[0][0]-time.monotonic()-self.spin)
+					self.wakeups += 1
+				if not self.running:
+					break
+				deadline,_,gen,clock = heapq.heappop(self.heap)
+				if gen in self.cancelled:
+					self.cancelled.discard(gen)
+					gen.close()
+					continue
+			while time.monotonic() < deadline:
+				pass
+			clock.record(time.monotonic()-deadline)
+			self.steps += 1
+			try:
+				dt = next(gen)
+			except StopIteration:
+				continue
+			except Exception as e:
+				print('task stopped by exception:',repr(e))
+				continue
+			finally:
+				self.cpu = time.thread_time()-cpu0
+			clock.advance(dt)
+			with self.cond:
+				heapq.heappush(self.heap,(clock.deadline,next(self.order),gen,clock))
+				
+	def start(self):
+		with self.cond:
+			if self.running:
+				return
+			self.running = True
+			self.t0 = time.monotonic()
+			self.wakeups = 0
+			self.steps = 0
+			self.thread = threading.Thread(target=self._run,daemon=True)
+			self.thread.start()
+			
+	def stop(self):
+		# stop the loop, dropping all the tasks
+		with self.cond:
+			self.running = False
+			self.cond.notify()
+		if self.thread is not None:
+			self.thread.join()
+			self.thread = None
+		with self.cond:
+			for _,_,gen,_ in self.heap:
+				gen.close()
+			self.heap = []
+			
+	def stats(self):
+		# CPU usage of the loop thread and wakeups per second since start
+		wall = time.monotonic()-self.t0 if self.t0 is not None else 0.0
+		return({'tasks':len(self.heap),'wall':wall,'cpu':self.cpu/wall if wall > 0 else 0.0,
+				'wakeups':self.wakeups/wall if wall > 0 else 0.0,
+				'steps':self.steps/wall if wall > 0 else 0.0})
+
+loop = eventloop()
+
+def spawn(gen,track=None,delay=0.0):
+	return(loop.spawn(gen,track,delay))
+
+# beat-locked timing
+
+class beatclock:
+	'''
+	Phase-locked estimate of Live's transport from the /live/song/beat stream
+	the arrival times of the last window beats are fitted with a straight line
+	(time = t0 + beat*period), discarding the arrivals that deviate from the fit by more
+	than jitter periods, so that the estimate is not thrown off by network jitter
+	usage:
+		sync = beatclock().start()
+		playerB.spawn(clips,0,sync=sync)
+	'''
+	def __init__(self,window=16,jitter=0.1):
+		self.window = window
+		self.jitter = jitter
+		self.beats = collections.deque(maxlen=window)
+		self.times = collections.deque(maxlen=window)
+		self.lock = threading.Lock()
+		self.period = 60.0/cfg.tempo
+		self.t0 = None
+		self.rejected = 0
+		self.misses = 0
+		
+	def update(self,address,args):
+		if address == '/live/song/beat' and len(args) > 0:
+			self.beat(args[0],time.monotonic())
+			
+	def beat(self,n,t):
+		with self.lock:
+			if len(self.beats) > 0 and n <= self.beats[-1]:
+				# transport restarted or moved back: start a new fit
+				self.beats.clear()
+				self.times.clear()
+			if len(self.beats) >= 4:
+				err = t-(self.t0+n*self.period)
+				if abs(err) > self.jitter*self.period:
+					self.misses += 1
+					if self.misses < 3:
+						# late or early beyond the jitter band: keep it out of the fit
+						self.rejected += 1
+						return
+					# three in a row: the tempo has changed, start a new fit
+					self.beats.clear()
+					self.times.clear()
+				self.misses = 0
+			self.beats.append(n)
+			self.times.append(t)
+			if len(self.beats) == 1:
+				self.t0 = t-n*self.period
+			else:
+				b = np.array(self.beats,dtype=float)
+				tt = np.array(self.times)
+				self.period,self.t0 = np.polyfit(b,tt,1)
+				cfg.tempo = 60.0/self.period
+	
+	def start(self,host=cfg.HOST,port=cfg.PORT):
+		# subscribe to the beat stream (received by osctools.server or an asynctools transport)
+		if self.update not in watchers:
+			watchers.append(self.update)
+		client("/live/song/start_listen/beat",[],host,port).send()
+		return(self)
+	
+	def stop(self,host=cfg.HOST,port=cfg.PORT):
+		client("/live/song/stop_listen/beat",[],host,port).send()
+		if self.update in watchers:
+			watchers.remove(self.update)
+			
+	def tempo(self):
+		return(60.0/self.period)
+	
+	def position(self,t=None):
+		# beat position (float) of Live's transport at monotonic time t (now if None)
+		if t is None:
+			t = time.monotonic()
+		with self.lock:
+			if self.t0 is None:
+				# no beat received yet: free-running clock from now at cfg.tempo
+				self.t0 = t
+			return((t-self.t0)/self.period)
+		
+	def timeof(self,beat):
+		# monotonic time of a beat position
+		with self.lock:
+			if self.t0 is None:
+				self.t0 = time.monotonic()
+			return(self.t0+beat*self.period)
+		
+	def grid(self,subdivision=1.0,after=None):
+		# first beat position on the subdivision grid at or after the monotonic time after
+		pos = self.position(after)
+		return(np.ceil(pos/subdivision-1e-6)*subdivision)
+
+# lookahead sending
+#
+# receivers that honor OSC timetags (SpatGRIS, a pyo bridge...) are listed in cfg.TIMETAGS
+# as (host,port): the events for them are sent lookahead seconds before their onset in a
+# bundle timetagged with the onset, so the wakeup jitter of the Python task and the network
+# latency are absorbed by the receiver. Live executes bundles on arrival and gets its events
+# just in time
+
+# senders of the players by track, for the onset statistics
+senders = {}
+
+class sender:
+	'''
+	Sends the events of a task at their onset times (time.monotonic())
+	compensate = True sends the just-in-time events lookahead early as well (to make up for the
+	network latency, e.g. when the onsets come from a beatclock)
+	usage (inside a task):
+		out = sender(host,port,track=track)
+		for ev in events:
+			yield out.wait(onset)
+			out.send(address,values)
+	'''
+	def __init__(self,host=cfg.HOST,port=cfg.PORT,lookahead=None,track=None,compensate=False):
+		self.host = host
+		self.port = port
+		self.lookahead = cfg.LOOKAHEAD if lookahead is None else lookahead
+		self.timetags = (host,port) in cfg.TIMETAGS
+		self.early = self.lookahead if self.timetags or compensate else 0.0
+		self.onset = None
+		self.events = 0
+		self.error = 0.0
+		self.error2 = 0.0
+		self.maxerror = 0.0
+		self.margin = 0.0
+		# events sent more than lookahead after their wakeup deadline (past the onset if timetagged)
+		self.late = 0
+		if track is not None:
+			senders[track] = self
+			
+	def wait(self,onset):
+		# deadline to yield before sending the events of onset
+		self.onset = onset
+		return(at(onset-self.early))
+	
+	def send(self,address,values):
+		now = time.monotonic()
+		target = self.onset-self.early
+		if self.timetags:
+			bundle(self.host,self.port,self.onset-now).add(address,values).send()
+			# the receiver is on time unless the bundle leaves after its timetag
+			err = max(now-self.onset,0.0)
+			self.margin += self.onset-now
+		else:
+			client(address,values,self.host,self.port).send()
+			err = now-target
+		if now-target > self.lookahead:
+			self.late += 1
+		self.events += 1
+		self.error += err
+		self.error2 += err*err
+		self.maxerror = max(self.maxerror,abs(err))
+		
+	def stats(self):
+		n = max(self.events,1)
+		mean = self.error/n
+		return({'events':self.events,'timetags':self.timetags,'mean':mean,
+				'std':np.sqrt(max(self.error2/n-mean*mean,0.0)),'max':self.maxerror,
+				'margin':self.margin/n,'late':self.late/n})
+
+def onsetStats(verbose=True):
+	# onset error of the events sent by the players of all the tracks
+	stats = {track:out.stats() for track,out in senders.items()}
+	if verbose:
+		for track,st in sorted(stats.items()):
+			print('track {:3d}: {:6d} events {:9s}  mean {:8.3f} ms  std {:8.3f} ms  max {:8.3f} ms  late {:6.2f} %'.format(
+				track,st['events'],'timetags' if st['timetags'] else 'jit',
+				1000*st['mean'],1000*st['std'],1000*st['max'],100*st['late']))
+	return(stats)
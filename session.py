@@ -6,58 +6,201 @@
 
 # container functions
 
-import time
+import time, json, hashlib
 
 from .base import *
+from .osctools import queryAll
 import msctools.cfg as cfg
 
-def trackList(session):
+# all the queries of one level (clip slots, devices) are pipelined with queryAll,
+# so each level costs roughly one network round-trip instead of one per object
+
+def _report(level,nquery,nreply,t0,verbose):
+	if verbose:
+		print('{:10s} {:6d} queries {:6d} replies {:8.3f} s'.format(level,nquery,nreply,time.perf_counter()-t0))
+
+def trackList(session,verbose=False):
+	t0 = time.perf_counter()
 	num_tracks = session.num_tracks()
 	tracks = []
 	for t in range(num_tracks):
-		tracks.append(Track(t))
-	time.sleep(cfg.TICK)
+		tracks.append(Track(t,session.host,session.port))
+	_report('tracks',1,1,t0,verbose)
 	return(tracks)
 
-def clipList(session,tracks):
-	num_tracks = session.num_tracks()
+def clipList(session,tracks,verbose=False):
+	# the clip names of a track come back in a single reply, one entry per slot (None if empty)
+	t0 = time.perf_counter()
+	num_tracks = len(tracks)
+	names = queryAll([("/live/track/get/clips/name",[n]) for n in range(num_tracks)],session.host,session.port)
 	num_clips = []
-	for n in range(num_tracks):
-		nclips = 0
-		for i in range(tracks[0].nclips()):
-		    try:
-		        if Clip(n,i).name(mode='get') != None:
-		            nclips += 1
-		    except:
-		        pass
-		num_clips.append(nclips)
+	for args in names:
+		if args is None:
+			num_clips.append(0)
+		else:
+			num_clips.append(sum(name != None for name in args[1:]))
 	clips = []
 	for n in range(num_tracks):
 		clp = []
 		for i in range(num_clips[n]):
-			clp.append(Clip(n,i))
+			clp.append(Clip(n,i,session.host,session.port))
 		clips.append(clp)
-	time.sleep(cfg.TICK)
+	_report('clips',num_tracks,sum(args is not None for args in names),t0,verbose)
 	return(clips)
 
-def deviceList(session,tracks):
-	num_tracks = session.num_tracks()
-	num_devices = []
-	for n in range(num_tracks):
-		num_devices.append(tracks[n].ndevices())
+def deviceList(session,tracks,verbose=False):
+	t0 = time.perf_counter()
+	num_tracks = len(tracks)
+	ndev = queryAll([("/live/track/get/num_devices",[n]) for n in range(num_tracks)],session.host,session.port)
+	num_devices = [args[1] if args is not None else 0 for args in ndev]
 	devices = []
 	for n in range(num_tracks):
 		dvc = []
 		for i in range(num_devices[n]):
-			dvc.append(Device(n,i))
+			dvc.append(Device(n,i,host=session.host,port=session.port))
 		devices.append(dvc)
-	time.sleep(cfg.TICK)
+	_report('devices',num_tracks,sum(args is not None for args in ndev),t0,verbose)
 	return(devices)
 
-def setSession():
-	session = Song()
-	tracks = trackList(session)
-	clips = clipList(session,tracks)
-	devices = deviceList(session,tracks)
-	time.sleep(cfg.TICK)
-	return(session,tracks,devices,clips)
\ No newline at end of file
+def clipDurations(session,clips,files=None,verbose=False):
+	# prefetch the durations of the whole clip grid so that Clip.dur() never waits for Live or the disk
+	# files = file paths of the clips (same layout as clips), queried in one pipelined batch if not given
+	t0 = time.perf_counter()
+	grid = [clip for clp in clips for clip in clp]
+	if files is None:
+		res = queryAll([("/live/clip/get/file_path",[clip.n,clip.c]) for clip in grid],session.host,session.port)
+		paths = [args[2] if args is not None else None for args in res]
+	else:
+		paths = [fil for fls in files for fil in fls]
+	nread = 0
+	for clip,fil in zip(grid,paths):
+		try:
+			clip.prefetch(fil)
+			nread += 1
+		except (OSError,TypeError,ValueError):
+			# no file for this clip (or not accessible from here)
+			pass
+	_report('durations',len(grid),nread,t0,verbose)
+
+def setSession(host=cfg.HOST,port=cfg.PORT,verbose=False,durations=True):
+	t0 = time.perf_counter()
+	session = Song(host,port)
+	tracks = trackList(session,verbose)
+	clips = clipList(session,tracks,verbose)
+	devices = deviceList(session,tracks,verbose)
+	if durations:
+		clipDurations(session,clips,verbose=verbose)
+	if verbose:
+		print('session discovered in {:.3f} s'.format(time.perf_counter()-t0))
+	return(session,tracks,devices,clips)
+
+# on-disk snapshot of the session structure
+#
+# loadSession() is a drop-in replacement for setSession() that reloads the structure
+# (clip names and file paths, device and parameter names/min/max) from a json snapshot
+# when the fingerprint of the set (track/scene counts and track names) has not changed,
+# and rescans only the tracks whose clip or device names differ when it has
+
+def fingerprint(session):
+	# cheap fingerprint of the Live set: a single pipelined round-trip
+	ntr,nsc,names = queryAll([("/live/song/get/num_tracks",[]),("/live/song/get/num_scenes",[]),
+							("/live/song/get/track_names",[])],session.host,session.port)
+	assert ntr is not None and nsc is not None, 'no reply from Live'
+	ntr = ntr[0]
+	nsc = nsc[0]
+	if names is None or len(names) != ntr:
+		names = [args[1] if args is not None else None for args in 
+				queryAll([("/live/track/get/name",[n]) for n in range(ntr)],session.host,session.port)]
+	key = hashlib.sha1(json.dumps([ntr,nsc,list(names)]).encode()).hexdigest()
+	return(key,ntr,nsc,list(names))
+
+def _scanTracks(session,tracklist):
+	# level 1: clip slot names and device names of each track
+	q = []
+	for n in tracklist:
+		q += [("/live/track/get/clips/name",[n]),("/live/track/get/devices/name",[n])]
+	res = queryAll(q,session.host,session.port)
+	scan = {}
+	for k,n in enumerate(tracklist):
+		slots,devs = res[2*k],res[2*k+1]
+		scan[n] = {'slots':list(slots[1:]) if slots is not None else [],
+					'devices':list(devs[1:]) if devs is not None else []}
+	return(scan)
+
+def _scanContents(session,scan):
+	# level 2: file paths of the clips and parameter names/min/max of the devices
+	q = []
+	for n,tr in scan.items():
+		nclips = sum(name != None for name in tr['slots'])
+		for i in range(nclips):
+			q.append(("/live/clip/get/file_path",[n,i]))
+		for d in range(len(tr['devices'])):
+			for what in ['name','min','max']:
+				q.append(("/live/device/get/parameters/"+what,[n,d]))
+	res = iter(queryAll(q,session.host,session.port))
+	for n,tr in scan.items():
+		nclips = sum(name != None for name in tr['slots'])
+		tr['files'] = []
+		for i in range(nclips):
+			args = next(res)
+			tr['files'].append(args[2] if args is not None else None)
+		devs = []
+		for d,name in enumerate(tr['devices']):
+			dev = {'name':name}
+			for what in ['name','min','max']:
+				args = next(res)
+				dev['params' if what == 'name' else what] = list(args[2:]) if args is not None else []
+			devs.append(dev)
+		tr['devices'] = devs
+	return(scan)
+
+def saveSnapshot(snapshot,filename='session.json'):
+	with open(filename,'w') as f:
+		json.dump(snapshot,f,separators=(',',':'))
+
+def loadSnapshot(filename='session.json'):
+	try:
+		with open(filename) as f:
+			return(json.load(f))
+	except (OSError,ValueError):
+		return(None)
+
+def loadSession(filename='session.json',host=cfg.HOST,port=cfg.PORT,verbose=False,durations=True):
+	t0 = time.perf_counter()
+	session = Song(host,port)
+	key,ntr,nsc,names = fingerprint(session)
+	snapshot = loadSnapshot(filename)
+	if snapshot is not None and snapshot.get('fingerprint') == key:
+		status = 'cached'
+	else:
+		# revalidate: level 1 for every track, level 2 only where the names changed
+		old = snapshot['tracks'] if snapshot is not None and snapshot.get('num_scenes') == nsc else []
+		scan = _scanTracks(session,list(range(ntr)))
+		changed = {}
+		tracklist = []
+		for n in range(ntr):
+			if n < len(old) and old[n]['name'] == names[n] and old[n]['slots'] == scan[n]['slots'] and \
+				[dev['name'] for dev in old[n]['devices']] == scan[n]['devices']:
+				tracklist.append(old[n])
+			else:
+				changed[n] = scan[n]
+				tracklist.append(None)
+		_scanContents(session,changed)
+		for n,tr in changed.items():
+			tr['name'] = names[n]
+			tracklist[n] = tr
+		snapshot = {'fingerprint':key,'num_scenes':nsc,'tracks':tracklist}
+		saveSnapshot(snapshot,filename)
+		status = 'rescanned {} of {} tracks'.format(len(changed),ntr)
+	tracks = [Track(n,host,port) for n in range(ntr)]
+	clips = []
+	devices = []
+	for n,tr in enumerate(snapshot['tracks']):
+		clips.append([Clip(n,i,host,port) for i in range(len(tr['files']))])
+		devices.append([Device(n,d,host=host,port=port) for d in range(len(tr['devices']))])
+	session.snapshot = snapshot
+	if durations:
+		clipDurations(session,clips,[tr['files'] for tr in snapshot['tracks']],verbose)
+	if verbose:
+		print('session {} in {:.3f} s'.format(status,time.perf_counter()-t0))
+	return(session,tracks,devices,clips)
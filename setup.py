@@ -14,5 +14,6 @@ setup(name='msctools',
 	url='https://www.musicntwrk.com',
 	packages=['msctools'],
 	package_dir={'msctools':'./'},
+	package_data={'msctools':['pcs_dictionary.json']},
 	install_requires=['numpy','scipy','networkx','music21','librosa','pyo'],
 )
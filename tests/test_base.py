@@ -0,0 +1,32 @@
+import os, wave
+
+from msctools.base import Clip
+from msctools.mirror import state
+
+def _wav(path,seconds,rate=8000):
+	with wave.open(str(path),'wb') as w:
+		w.setnchannels(1)
+		w.setsampwidth(2)
+		w.setframerate(rate)
+		w.writeframes(b'\x00\x00'*int(seconds*rate))
+	return(str(path))
+
+def test_clip_duration_follows_a_replaced_sample(tmp_path,monkeypatch):
+	first = _wav(tmp_path/'a.wav',1.0)
+	second = _wav(tmp_path/'b.wav',2.0)
+	clip = Clip(7,3,port=9)
+	monkeypatch.setattr(clip,'fpath',lambda: first)
+	assert clip.dur() == 1.0
+	# Live pushes the new file path of the slot, the old file is still on disk
+	key = ("/live/clip/get/file_path",(7,3))
+	monkeypatch.setitem(state.watched,key,('127.0.0.1',9))
+	state.update("/live/clip/get/file_path",[7,3,second])
+	try:
+		monkeypatch.setattr(clip,'fpath',lambda: second)
+		assert clip.dur() == 2.0
+	finally:
+		state.values.pop(key,None)
+	# a re-rendered file is read again
+	_wav(tmp_path/'b.wav',3.0)
+	os.utime(second,(0,12345))
+	assert clip.dur() == 3.0
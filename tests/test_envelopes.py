@@ -0,0 +1,57 @@
+import time, threading
+from types import SimpleNamespace
+
+import msctools.envelopes as envelopes
+from msctools.envelopes import engine, envelope
+
+def _until(cond,timeout=2.0):
+	t0 = time.monotonic()
+	while not cond() and time.monotonic()-t0 < timeout:
+		time.sleep(0.005)
+	return(cond())
+
+def test_engine_plays_again_after_failed_run(monkeypatch):
+	track = SimpleNamespace(host='127.0.0.1',port=9,n=0)
+	dyn = engine(rate=0.005)
+	def fail(messages,**kwargs):
+		raise OSError('send failed')
+	monkeypatch.setattr(envelopes,'bundleSend',fail)
+	env = dyn.play(envelope([track],[0.1,0.2,0.3],rate=0.005))
+	assert _until(lambda: env.done and dyn.task is None)
+	sent = []
+	monkeypatch.setattr(envelopes,'bundleSend',lambda messages,**kwargs: sent.extend(messages))
+	env = dyn.play(envelope([track],[0.4,0.5,0.6],rate=0.005))
+	assert _until(lambda: env.done and dyn.task is None)
+	assert [m[1][1] for m in sent] == [0.4,0.5,0.6]
+
+def test_spatdriver_moves_again_after_failed_run(monkeypatch):
+	driver = envelopes.spatdriver(port=9,rate=0.005,nsource=2)
+	def fail(self,*args,**kwargs):
+		raise OSError('send failed')
+	monkeypatch.setattr(envelopes.bundle,'send',fail)
+	driver.line(0,[0,0,0],[1,0,0],0.05)
+	assert _until(lambda: driver.task is None)
+	assert not driver.moving(0)
+	monkeypatch.undo()
+	driver.line(0,[0,0,0],[1,0,0],0.05)
+	assert _until(lambda: driver.task is None)
+	assert driver.ticks > 0
+
+def test_circles_return_when_the_source_is_stopped(monkeypatch):
+	monkeypatch.setattr(envelopes,'swarm',envelopes.spatdriver(port=9,rate=0.005))
+	monkeypatch.setattr(envelopes.cfg,'stop_source',envelopes.cfg.stop_source.copy())
+	def stop():
+		time.sleep(0.05)
+		envelopes.cfg.stop_source[0] = True
+	threading.Thread(target=stop).start()
+	t0 = time.monotonic()
+	envelopes.circlesCar(0,0,90,1.0,2.0)
+	assert time.monotonic()-t0 < 0.5
+
+def test_zero_duration_trajectories_send_the_end_position():
+	sent = []
+	device = SimpleNamespace(car=lambda x,y,z,*args: sent.append((x,y,z)))
+	envelopes.lineCycle(None,device,1.0,0.0,0.0,2.0,cycle=1,dir='r')
+	envelopes.lineCycle(None,device,-0.5,0.0,0.0,0.0,cycle=2,dir='r')
+	envelopes.lines(None,device,[0,0,0],[1,0,0],0.0,cycle=2)
+	assert sent == [(1.0,0.0,0.0),(-1.0,0.0,0.0),(0.0,0.0,0.0)]
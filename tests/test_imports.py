@@ -0,0 +1,16 @@
+import os, sys, subprocess
+
+HEAVY = ['pyo','music21','networkx']
+
+def _imported(statement):
+	# heavy modules in sys.modules after statement, in a fresh interpreter
+	code = '{}\nimport sys\nprint(" ".join(m for m in {!r} if m in sys.modules))'.format(statement,HEAVY)
+	env = dict(os.environ,PYTHONPATH=os.pathsep.join(sys.path))
+	out = subprocess.run([sys.executable,'-c',code],capture_output=True,text=True,env=env,check=True)
+	return(out.stdout.split())
+
+def test_package_import_is_light():
+	assert _imported('import msctools') == []
+
+def test_api_import_is_light():
+	assert _imported('from msctools import Track, Clip, client, spawn, db2value') == []
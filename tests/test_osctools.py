@@ -0,0 +1,56 @@
+import socket
+from types import SimpleNamespace
+
+import msctools.osctools as osctools
+from msctools.osctools import coalescer, close_pool
+from msctools.devices import Dolby
+
+def _sink():
+	sock = socket.socket(socket.AF_INET,socket.SOCK_DGRAM)
+	sock.bind(('127.0.0.1',0))
+	sock.settimeout(0.2)
+	return(sock,sock.getsockname()[1])
+
+def _datagrams(sock):
+	n = 0
+	try:
+		while True:
+			sock.recv(65536)
+			n += 1
+	except socket.timeout:
+		return(n)
+
+def test_coalescing_covers_bundled_positions(monkeypatch):
+	sock,port = _sink()
+	latest = coalescer()
+	# flushed by hand below, not by the background thread
+	monkeypatch.setattr(latest,'start',lambda: None)
+	monkeypatch.setattr(osctools,'latest',latest)
+	monkeypatch.setattr(osctools.cfg,'COALESCE',True)
+	panner = SimpleNamespace(n=0,d=1,host='127.0.0.1',port=port)
+	for k in range(20):
+		Dolby.position(panner,[0.01*k,0.5,0.0],mode='set')
+	latest.flush()
+	assert _datagrams(sock) == 1
+	assert latest.stats()['sent'] == 3
+	monkeypatch.setattr(osctools.cfg,'COALESCE',False)
+	for k in range(20):
+		Dolby.position(panner,[0.01*k,0.5,0.0],mode='set')
+	assert _datagrams(sock) == 20
+	close_pool()
+	sock.close()
+
+def test_delta_filter_keeps_toggles_and_drops_float_repeats(monkeypatch):
+	sock,port = _sink()
+	monkeypatch.setattr(osctools,'changes',osctools.deltafilter())
+	monkeypatch.setattr(osctools.cfg,'DELTA',True)
+	for k in range(5):
+		osctools.client("/live/track/set/arm",[0,1],'127.0.0.1',port).send()
+		osctools.client("/live/clip/set/name",[0,0,'a'],'127.0.0.1',port).send()
+		osctools.client("/live/track/set/volume",[0,0.5],'127.0.0.1',port).send()
+	assert _datagrams(sock) == 11
+	osctools.changes.reset()
+	osctools.client("/live/track/set/volume",[0,0.5],'127.0.0.1',port).send()
+	assert _datagrams(sock) == 1
+	close_pool()
+	sock.close()
@@ -19,4 +19,37 @@ def importSoundfiles(dirpath='./',filepath='./'):
 	except:
 		print('error in file reading',dirpath+filepath)
 		pass
-	return(fil)
\ No newline at end of file
+	return(fil)
+
+class lazy:
+	# stand-in for a heavy module (or an object from it) that is imported on first use
+	#	m21 = lazy('music21')
+	#	scoreFilter = lazy('musicntwrk.harmony.scoreFilter','scoreFilter')
+	#	mk = lazy('musicntwrk.musicntwrk','musicntwrk',TET=12)	# instance built on first use
+	def __init__(self,module,name=None,**kwargs):
+		self._module = module
+		self._name = name
+		self._kwargs = kwargs
+		self._obj = None
+		
+	def _load(self):
+		if self._obj is None:
+			import importlib
+			obj = importlib.import_module(self._module)
+			if self._name is not None:
+				obj = getattr(obj,self._name)
+				if len(self._kwargs) > 0:
+					obj = obj(**self._kwargs)
+			self._obj = obj
+		return(self._obj)
+	
+	def __getattr__(self,attr):
+		return(getattr(self._load(),attr))
+	
+	def __call__(self,*args,**kwargs):
+		return(self._load()(*args,**kwargs))
+	
+	def __repr__(self):
+		if self._obj is None:
+			return('<lazy {}>'.format(self._module+('.'+self._name if self._name else '')))
+		return(repr(self._obj))